@@ -1,16 +1,9 @@
 """Basic data collection script using proper-test-index."""
 
-import json
 import logging
 from pathlib import Path
 
-import polars as pl
-from attrs import asdict
-from dotenv import load_dotenv
-from slugify import slugify
-
-from proper_test_index.collect import collect_raw_event_data, retrieve_event_list
-from proper_test_index.schemas import ScoreObject, to_schema
+from proper_test_index.cli import run_collect
 
 LOG = logging.getLogger(__name__)
 
@@ -73,29 +66,6 @@ DATA_DIR = CURR_DIR / "data"
 
 
 if __name__ == "__main__":
-    # Set up logging
     logging.basicConfig(level=logging.INFO)
-    # Load the dotenv file
-    load_dotenv(CURR_DIR / ".env")
-
-    DATA_DIR.mkdir(exist_ok=True)
-    if not (DATA_DIR / "all-events.json").exists():
-        events = retrieve_event_list()
-        with open(DATA_DIR / "all-events.json", "w") as outfile:
-            json.dump(events, outfile, indent=4)
 
-    for evt in retrieve_event_list():
-        folder = DATA_DIR / str(evt["calendar_year"])
-        folder.mkdir(exist_ok=True)
-        fpath = folder / f"{slugify(evt['event_name'])}-scoring-data.parquet"
-        if fpath.exists():
-            LOG.info(
-                "%i %s data already exists...", evt["calendar_year"], evt["event_name"]
-            )
-            continue
-        score_raw_ = collect_raw_event_data(evt)
-        score_data = pl.DataFrame(
-            [asdict(obj) for obj in score_raw_],
-            schema=to_schema(ScoreObject),
-        )
-        score_data.write_parquet(fpath, use_pyarrow=True)
+    run_collect(DATA_DIR, env_file=CURR_DIR / ".env")
@@ -0,0 +1,5 @@
+"""Run the command line interface with ``python -m proper_test_index``."""
+
+from proper_test_index.cli import main
+
+main()
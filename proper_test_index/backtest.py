@@ -0,0 +1,234 @@
+"""Predictive-validity backtests for the proper player index."""
+
+from collections.abc import Iterable
+
+import polars as pl
+from polars._typing import FrameType
+
+from proper_test_index.ppi import (
+    calc_ewm_ppi,
+    calc_weighted_differential,
+    gen_enriched_rounds,
+    join_course_factor,
+)
+
+
+def gen_ppi_predictions(
+    scoring: FrameType,
+    course_factor: FrameType,
+    periods: Iterable[int] = (25, 50, 75, 100),
+    half_lives: Iterable[float] = (),
+    horizon: int = 25,
+    reference: FrameType | None = None,
+) -> FrameType:
+    """Pipe-compatible function for pairing PPI predictions with future performance.
+
+    For each round, the rolling PPI over the last ``period`` rounds and the decayed PPI are
+    compared with the PPI over the player's next ``horizon`` rounds, weighted by the
+    ``reference`` course factor. Every window is a difference of per-player cumulative
+    sums, so all of the configurations are calculated in a single pass over the rounds.
+
+    Parameters
+    ----------
+    scoring : dataframe-like
+        A polars dataframe/lazyframe with round-by-round scoring data. The dataframe output
+        from :py:meth:`proper_test_index.collect.collect_raw_event_data`.
+    course_factor : dataframe-like
+        The output from :py:meth:`proper_player_index.pti.calc_course_factor` or
+        :py:meth:`proper_player_index.pti.calc_era_course_factor`.
+    periods : iterable of int, optional (default (25, 50, 75, 100))
+        The rolling PPI periods.
+    half_lives : iterable of float, optional (default ())
+        The decayed PPI half-lives, in rounds.
+    horizon : int, optional (default 25)
+        The number of future rounds to predict.
+    reference : dataframe-like, optional (default None)
+        The course factor for the future PPI. Defaults to ``course_factor``. Use the same
+        reference to compare course factor variants against the same targets.
+
+    Returns
+    -------
+    dataframe-like
+        One row per configuration and round, with the ``method`` (rolling or ewm), the
+        ``parameter`` (period or half-life), the ``prediction`` and the future PPI
+        (``target``). Only rounds with at least ``max(periods)`` prior
+        rounds, ``horizon`` future rounds and a finite prediction from every configuration
+        are included, so every configuration shares a sample.
+    """
+    periods = list(periods)
+    half_lives = list(half_lives)
+    if not periods and not half_lives:
+        raise ValueError("Please provide at least one period or half-life.")
+    if horizon < 1:
+        raise ValueError("The horizon must be at least one round.")
+    history = max(periods, default=1)
+    if reference is None:
+        reference = course_factor
+    keys = (
+        ["course_num", "era"] if "era" in reference.collect_schema() else ["course_num"]
+    )
+    predictions: dict[str, pl.Expr] = {}
+    for value in periods:
+        predictions[f"rolling_{value}"] = (
+            pl.col("cum_weighted") - pl.col("cum_weighted").shift(value, fill_value=0)
+        ) / (pl.col("cum_factor") - pl.col("cum_factor").shift(value, fill_value=0))
+    for value in half_lives:
+        predictions[f"ewm_{value:g}"] = calc_ewm_ppi(
+            pl.col("score"), pl.col("wave_average"), pl.col("factor"), half_life=value
+        )
+
+    return (
+        join_course_factor(
+            scoring,
+            reference.select(*keys, reference_factor=pl.col("course_factor_star")),
+        )
+        .pipe(gen_enriched_rounds, course_factor)
+        .sort("dg_id", "teetime", descending=False)
+        # Rounds without a finite course factor carry no weight
+        .with_columns(
+            factor=pl.when(pl.col("course_factor_star").is_finite())
+            .then(pl.col("course_factor_star"))
+            .otherwise(0.0),
+            reference_factor=pl.when(pl.col("reference_factor").is_finite())
+            .then(pl.col("reference_factor"))
+            .otherwise(0.0),
+        )
+        .with_columns(
+            weighted=calc_weighted_differential(
+                pl.col("score"), pl.col("wave_average"), pl.col("factor")
+            ),
+            reference_weighted=calc_weighted_differential(
+                pl.col("score"), pl.col("wave_average"), pl.col("reference_factor")
+            ),
+        )
+        .with_columns(
+            rounds=pl.col("teetime").cum_count().over("dg_id"),
+            cum_weighted=pl.col("weighted").cum_sum().over("dg_id"),
+            cum_factor=pl.col("factor").cum_sum().over("dg_id"),
+            cum_reference_weighted=pl.col("reference_weighted").cum_sum().over("dg_id"),
+            cum_reference_factor=pl.col("reference_factor").cum_sum().over("dg_id"),
+        )
+        .with_columns(
+            *[expr.over("dg_id").alias(name) for name, expr in predictions.items()],
+            target=(
+                (
+                    pl.col("cum_reference_weighted").shift(-horizon)
+                    - pl.col("cum_reference_weighted")
+                )
+                / (
+                    pl.col("cum_reference_factor").shift(-horizon)
+                    - pl.col("cum_reference_factor")
+                )
+            ).over("dg_id"),
+        )
+        .filter(
+            pl.col("rounds") >= history,
+            pl.all_horizontal(pl.col([*predictions, "target"]).is_finite()),
+        )
+        .unpivot(
+            index=["dg_id", "teetime", "target"],
+            on=list(predictions),
+            variable_name="config",
+            value_name="prediction",
+        )
+        .with_columns(
+            method=pl.col("config").str.split("_").list.first(),
+            parameter=pl.col("config").str.split("_").list.last().cast(pl.Float64),
+        )
+        .drop("config")
+    )
+
+
+def calc_backtest_metrics(predictions: FrameType) -> FrameType:
+    """Summarize the predictive validity of each configuration.
+
+    Parameters
+    ----------
+    predictions : dataframe-like
+        The output from :py:meth:`proper_test_index.backtest.gen_ppi_predictions`.
+
+    Returns
+    -------
+    dataframe-like
+        The number of rounds, Pearson and Spearman correlation, root mean squared error,
+        mean absolute error and mean bias for each configuration.
+    """
+    error = pl.col("prediction") - pl.col("target")
+
+    return (
+        predictions.group_by("method", "parameter")
+        .agg(
+            rounds=pl.len(),
+            correlation=pl.corr("prediction", "target"),
+            rank_correlation=pl.corr("prediction", "target", method="spearman"),
+            rmse=(error**2).mean().sqrt(),
+            mae=error.abs().mean(),
+            bias=error.mean(),
+        )
+        .sort("correlation", descending=True)
+    )
+
+
+def backtest_ppi(
+    scoring: FrameType,
+    course_factors: dict[str, FrameType],
+    periods: Iterable[int] = (25, 50, 75, 100),
+    half_lives: Iterable[float] = (),
+    horizon: int = 25,
+    reference: str | None = None,
+) -> pl.DataFrame:
+    """Backtest PPI configurations against future performance.
+
+    The course factor variants are evaluated as separate queries that polars runs in
+    parallel; the periods and half-lives within each variant are parallelized by the
+    query engine.
+
+    Parameters
+    ----------
+    scoring : dataframe-like
+        A polars dataframe/lazyframe with round-by-round scoring data.
+    course_factors : dict[str, dataframe-like]
+        The course factor variants, by name. For example, the output from
+        :py:meth:`proper_player_index.pti.calc_course_factor` and
+        :py:meth:`proper_player_index.pti.calc_era_course_factor`.
+    periods : iterable of int, optional (default (25, 50, 75, 100))
+        The rolling PPI periods.
+    half_lives : iterable of float, optional (default ())
+        The decayed PPI half-lives, in rounds.
+    horizon : int, optional (default 25)
+        The number of future rounds to predict.
+    reference : str, optional (default None)
+        The variant used to weight the future PPI for every variant, so that they are
+        evaluated against the same targets. Defaults to the first variant.
+
+    Returns
+    -------
+    pl.DataFrame
+        The metrics from :py:meth:`proper_test_index.backtest.calc_backtest_metrics` for
+        each course factor variant and configuration.
+    """
+    periods = list(periods)
+    half_lives = list(half_lives)
+    if reference is None:
+        reference = next(iter(course_factors), None)
+    if reference not in course_factors:
+        raise ValueError(f"Unknown reference course factor: {reference}")
+    queries = [
+        calc_backtest_metrics(
+            gen_ppi_predictions(
+                scoring.lazy(),
+                course_factor.lazy(),
+                periods=periods,
+                half_lives=half_lives,
+                horizon=horizon,
+                reference=course_factors[reference].lazy(),
+            )
+        ).with_columns(course_factor=pl.lit(name))
+        for name, course_factor in course_factors.items()
+    ]
+
+    return (
+        pl.concat(pl.collect_all(queries))
+        .select("course_factor", pl.exclude("course_factor"))
+        .sort("correlation", descending=True)
+    )
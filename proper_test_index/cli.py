@@ -0,0 +1,374 @@
+"""Command line interface.
+
+Heavy dependencies (polars, requests) are imported inside each command so that
+``--help`` and short invocations don't pay for them.
+"""
+
+import argparse
+import logging
+from collections.abc import Sequence
+from pathlib import Path
+
+LOG = logging.getLogger(__name__)
+
+
+def run_collect(data_dir: Path, env_file: Path | None = None):
+    """Collect raw scoring data for every PGA Tour event.
+
+    Events that already have a scoring file are skipped.
+
+    Parameters
+    ----------
+    data_dir : Path
+        The output directory.
+    env_file : Path, optional (default None)
+        A dotenv file with the Data Golf ``API_TOKEN``.
+    """
+    import json
+
+    import polars as pl
+    from attrs import asdict
+    from dotenv import load_dotenv
+    from slugify import slugify
+
+    from proper_test_index.collect import collect_raw_event_data, retrieve_event_list
+    from proper_test_index.schemas import ScoreObject, to_schema
+
+    load_dotenv(env_file)
+
+    data_dir.mkdir(exist_ok=True)
+    events = retrieve_event_list()
+    if not (data_dir / "all-events.json").exists():
+        with open(data_dir / "all-events.json", "w") as outfile:
+            json.dump(events, outfile, indent=4)
+
+    for evt in events:
+        folder = data_dir / str(evt["calendar_year"])
+        folder.mkdir(exist_ok=True)
+        fpath = folder / f"{slugify(evt['event_name'])}-scoring-data.parquet"
+        if fpath.exists():
+            LOG.info(
+                "%i %s data already exists...", evt["calendar_year"], evt["event_name"]
+            )
+            continue
+        score_raw_ = collect_raw_event_data(evt)
+        score_data = pl.DataFrame(
+            [asdict(obj) for obj in score_raw_],
+            schema=to_schema(ScoreObject),
+        )
+        score_data.write_parquet(fpath, use_pyarrow=True)
+
+
+def run_aggregate(
+    data_dir: Path, output_dir: Path, periods: Sequence[int] = (25, 50, 75, 100)
+):
+    """Calculate the PTI, course factor and proper player indices.
+
+    Parameters
+    ----------
+    data_dir : Path
+        The directory with the raw scoring data. Rolling PPI files and invalid rounds
+        (``quarantine.parquet``) are also written here. Arrow IPC copies of the scoring
+        data and every output are written to ``.cache`` directories.
+    output_dir : Path
+        The output directory for ``pti.csv`` and ``course_factor.csv``.
+    periods : sequence of int, optional (default (25, 50, 75, 100))
+        The rolling PPI periods, which are also used as the decayed PPI half-lives.
+    """
+    from proper_test_index.ipc import CACHE_DIR, load_cached, write_cache
+    from proper_test_index.ppi import gen_ewm_ppi, gen_rolling_ppi
+    from proper_test_index.pti import calc_course_factor, calc_pti
+    from proper_test_index.schemas import ScoreObject, to_schema
+    from proper_test_index.validate import validate_scoring
+
+    scoring_data, report = validate_scoring(
+        load_cached(
+            list(data_dir.glob("**/*-scoring-data.parquet")),
+            schema=to_schema(ScoreObject),
+            cache_path=data_dir / CACHE_DIR / "scoring-data.arrow",
+        ),
+        quarantine_path=data_dir / "quarantine.parquet",
+    )
+    LOG.info(
+        "%i of %i rounds passed validation",
+        report.total_rounds - report.invalid_rounds,
+        report.total_rounds,
+    )
+    scoring_data = scoring_data.lazy()
+    pti = calc_pti(scoring_data)
+    pti_data = pti.collect()
+    pti_data.write_csv(output_dir / "pti.csv")
+    write_cache(pti_data, output_dir / "pti.csv")
+
+    course_factor = calc_course_factor(pti)
+    course_factor_data = course_factor.collect()
+    course_factor_data.write_csv(output_dir / "course_factor.csv")
+    write_cache(course_factor_data, output_dir / "course_factor.csv")
+
+    for value in periods:
+        rolling_ppi = gen_rolling_ppi(
+            scoring_data, course_factor_data.lazy(), period=value
+        ).collect()
+        rolling_ppi.write_parquet(
+            data_dir / f"ppi-rolling-{value}.parquet", use_pyarrow=True
+        )
+        write_cache(rolling_ppi, data_dir / f"ppi-rolling-{value}.parquet")
+
+    ewm_ppi = gen_ewm_ppi(
+        scoring_data, course_factor_data.lazy(), half_life=periods
+    ).collect()
+    ewm_ppi.write_parquet(data_dir / "ppi-ewm.parquet", use_pyarrow=True)
+    write_cache(ewm_ppi, data_dir / "ppi-ewm.parquet")
+
+
+def run_snapshot(
+    data_dir: Path,
+    output_dir: Path,
+    period: int = 50,
+    year: int | None = None,
+    max_days: int = 730,
+    dg_id: int = 14139,
+    player_file: str | None = None,
+):
+    """Write the current PPI and a single player's history for the blog post.
+
+    Parameters
+    ----------
+    data_dir : Path
+        The directory with the rolling PPI files.
+    output_dir : Path
+        The output directory for ``ppi-curr.csv`` and the player's history.
+    period : int, optional (default 50)
+        The rolling PPI period.
+    year : int, optional (default None)
+        Only include players with a round in this year. Defaults to the latest year.
+    max_days : int, optional (default 730)
+        The maximum number of days spanned by a player's rolling window.
+    dg_id : int, optional (default 14139)
+        The player for the history file.
+    player_file : str, optional (default None)
+        The name of the history file. Defaults to ``ppi-jt.csv`` for the default player
+        and ``ppi-<dg_id>.csv`` otherwise.
+    """
+    import polars as pl
+
+    from proper_test_index.ipc import load_cached, write_cache
+
+    if player_file is None:
+        player_file = "ppi-jt.csv" if dg_id == 14139 else f"ppi-{dg_id}.csv"
+    ppi = load_cached(data_dir / f"ppi-rolling-{period}.parquet").lazy()
+    if year is None:
+        year = ppi.select(pl.col("teetime").max().dt.year()).collect().item()
+    ppi_curr = (
+        ppi.sort("dg_id", "teetime", descending=False)
+        .group_by("dg_id")
+        .last()
+        .filter(
+            pl.col("teetime").dt.year() == year,
+            (pl.col("teetime") - pl.col("first_tee_time_in_group")).dt.total_days()
+            <= max_days,
+        )
+    )
+    ppi_curr_data = ppi_curr.collect()
+    ppi_curr_data.write_csv(output_dir / "ppi-curr.csv")
+    write_cache(ppi_curr_data, output_dir / "ppi-curr.csv")
+
+    ppi_player = (
+        ppi.filter(pl.col("dg_id") == dg_id)
+        .sort("teetime", descending=False)
+        .with_columns(
+            weighted_score=(pl.col("wave_average") - pl.col("score"))
+            * pl.col("course_factor_star")
+        )
+    )
+    ppi_player_data = ppi_player.collect()
+    ppi_player_data.write_csv(output_dir / player_file)
+    write_cache(ppi_player_data, output_dir / player_file)
+
+
+def run_backtest(
+    data_dir: Path,
+    output_dir: Path,
+    periods: Sequence[int] = (25, 50, 75, 100),
+    half_lives: Sequence[float] = (25, 50, 75, 100),
+    horizon: int = 25,
+    era_seasons: int = 5,
+):
+    """Backtest the PPI parameters against each player's future rounds.
+
+    Parameters
+    ----------
+    data_dir : Path
+        The directory with the raw scoring data.
+    output_dir : Path
+        The output directory for ``backtest.csv``.
+    periods : sequence of int, optional (default (25, 50, 75, 100))
+        The rolling PPI periods.
+    half_lives : sequence of float, optional (default (25, 50, 75, 100))
+        The decayed PPI half-lives, in rounds.
+    horizon : int, optional (default 25)
+        The number of future rounds to predict.
+    era_seasons : int, optional (default 5)
+        The number of seasons for the per-era course factor variant.
+    """
+    from proper_test_index.backtest import backtest_ppi
+    from proper_test_index.ipc import CACHE_DIR, load_cached
+    from proper_test_index.pti import (
+        calc_course_factor,
+        calc_era_course_factor,
+        calc_pti,
+    )
+    from proper_test_index.schemas import ScoreObject, to_schema
+    from proper_test_index.validate import validate_scoring
+
+    scoring_data, _ = validate_scoring(
+        load_cached(
+            list(data_dir.glob("**/*-scoring-data.parquet")),
+            schema=to_schema(ScoreObject),
+            cache_path=data_dir / CACHE_DIR / "scoring-data.arrow",
+        )
+    )
+    pti = calc_pti(scoring_data)
+    metrics = backtest_ppi(
+        scoring_data,
+        {
+            "pooled": calc_course_factor(pti),
+            f"era-{era_seasons}": calc_era_course_factor(pti, seasons=era_seasons),
+        },
+        periods=periods,
+        half_lives=half_lives,
+        horizon=horizon,
+        reference="pooled",
+    )
+    metrics.write_csv(output_dir / "backtest.csv")
+
+
+def run_serve(root: Path, host: str = "127.0.0.1", port: int = 8000):
+    """Serve the aggregated outputs.
+
+    Parameters
+    ----------
+    root : Path
+        The directory containing the ``aggregate`` outputs.
+    host : str, optional (default "127.0.0.1")
+        The host to bind.
+    port : int, optional (default 8000)
+        The port to bind.
+    """
+    import asyncio
+
+    from proper_test_index.serve import ArtifactStore, QueryService
+
+    asyncio.run(QueryService(ArtifactStore(root)).serve(host=host, port=port))
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Build the argument parser.
+
+    Returns
+    -------
+    argparse.ArgumentParser
+        The parser, with a subcommand for each step of the workflow.
+    """
+    parser = argparse.ArgumentParser(
+        prog="proper-test-index", description="Data Golf-powered statistics"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    collect = subparsers.add_parser("collect", help="Collect raw scoring data.")
+    collect.add_argument("--data-dir", type=Path, default=Path("data"))
+    collect.add_argument(
+        "--env-file", type=Path, default=Path(".env"), help="File with API_TOKEN."
+    )
+    collect.set_defaults(
+        func=lambda args: run_collect(args.data_dir, env_file=args.env_file)
+    )
+
+    aggregate = subparsers.add_parser("aggregate", help="Calculate PTI and PPI.")
+    aggregate.add_argument("--data-dir", type=Path, default=Path("data"))
+    aggregate.add_argument("--output-dir", type=Path, default=Path("."))
+    aggregate.add_argument(
+        "--period", type=int, nargs="+", default=[25, 50, 75, 100], dest="periods"
+    )
+    aggregate.set_defaults(
+        func=lambda args: run_aggregate(
+            args.data_dir, args.output_dir, periods=args.periods
+        )
+    )
+
+    snapshot = subparsers.add_parser("snapshot", help="Write the current PPI files.")
+    snapshot.add_argument("--data-dir", type=Path, default=Path("data"))
+    snapshot.add_argument("--output-dir", type=Path, default=Path("."))
+    snapshot.add_argument("--period", type=int, default=50)
+    snapshot.add_argument("--year", type=int, default=None)
+    snapshot.add_argument("--max-days", type=int, default=730)
+    snapshot.add_argument("--dg-id", type=int, default=14139)
+    snapshot.add_argument(
+        "--player-file",
+        default=None,
+        help="Defaults to ppi-jt.csv for the default player, ppi-<dg-id>.csv otherwise.",
+    )
+    snapshot.set_defaults(
+        func=lambda args: run_snapshot(
+            args.data_dir,
+            args.output_dir,
+            period=args.period,
+            year=args.year,
+            max_days=args.max_days,
+            dg_id=args.dg_id,
+            player_file=args.player_file,
+        )
+    )
+
+    backtest = subparsers.add_parser("backtest", help="Backtest PPI parameters.")
+    backtest.add_argument("--data-dir", type=Path, default=Path("data"))
+    backtest.add_argument("--output-dir", type=Path, default=Path("."))
+    backtest.add_argument(
+        "--period", type=int, nargs="+", default=[25, 50, 75, 100], dest="periods"
+    )
+    backtest.add_argument(
+        "--half-life",
+        type=float,
+        nargs="+",
+        default=[25, 50, 75, 100],
+        dest="half_lives",
+    )
+    backtest.add_argument("--horizon", type=int, default=25)
+    backtest.add_argument("--era-seasons", type=int, default=5)
+    backtest.set_defaults(
+        func=lambda args: run_backtest(
+            args.data_dir,
+            args.output_dir,
+            periods=args.periods,
+            half_lives=args.half_lives,
+            horizon=args.horizon,
+            era_seasons=args.era_seasons,
+        )
+    )
+
+    serve = subparsers.add_parser("serve", help="Serve the aggregated outputs.")
+    serve.add_argument("--root", type=Path, default=Path("."))
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8000)
+    serve.set_defaults(
+        func=lambda args: run_serve(args.root, host=args.host, port=args.port)
+    )
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None):
+    """Run the command line interface.
+
+    Parameters
+    ----------
+    argv : sequence of str, optional (default None)
+        The arguments. Defaults to ``sys.argv``.
+    """
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@
 import logging
 import os
 from datetime import datetime, timedelta
+from functools import cache
 from pathlib import Path
 
 import requests
@@ -16,15 +17,29 @@ LOG = logging.getLogger(__name__)
 CURR_DIR = Path(__file__).resolve().parent
 DATA_DIR = CURR_DIR / "data"
 
-SESSION = requests.Session()
-RETRIES = Retry(total=10, backoff_factor=2, status_forcelist=[502, 503, 504])
-ADAPTER = HTTPAdapter(max_retries=RETRIES)
-SESSION.mount("http://", ADAPTER)
-SESSION.mount("https://", ADAPTER)
-
 BASE_URL = "https://feeds.datagolf.com"
 
 
+@cache
+def get_session() -> requests.Session:
+    """Get the HTTP session, with retries.
+
+    The session is created on first use rather than at import time.
+
+    Returns
+    -------
+    requests.Session
+        The shared session.
+    """
+    session = requests.Session()
+    retries = Retry(total=10, backoff_factor=2, status_forcelist=[502, 503, 504])
+    adapter = HTTPAdapter(max_retries=retries)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+
+    return session
+
+
 def retrieve_event_list() -> list:
     """Get the list of PGA Tour event IDs.
 
@@ -34,7 +49,7 @@ def retrieve_event_list() -> list:
         The output from the event list API.
     """
     LOG.info("Retrieving list of events...")
-    response_ = SESSION.get(
+    response_ = get_session().get(
         f"{BASE_URL}/historical-raw-data/event-list",
         params={"file_format": "json", "key": os.getenv("API_TOKEN")},
     )
@@ -68,7 +83,7 @@ def collect_raw_event_data(event: dict) -> list[ScoreObject]:
         event["event_name"],
         event["event_id"],
     )
-    response_ = SESSION.get(
+    response_ = get_session().get(
         f"{BASE_URL}/historical-raw-data/rounds",
         params={
             "tour": "pga",
@@ -85,6 +100,26 @@ def collect_raw_event_data(event: dict) -> list[ScoreObject]:
         event["event_name"],
     )
     completion_date = datetime.strptime(response_.json()["event_completed"], "%Y-%m-%d")
+    # Make the assumption that round 1 is always on a Thursday
+    # Account for Monday finishes
+    if completion_date.weekday() == 0:
+        start_date = completion_date - timedelta(days=5)
+    elif completion_date.weekday() == 6:
+        start_date = completion_date - timedelta(days=4)
+    elif completion_date.weekday() == 5:
+        # 54-hole tournament
+        start_date = completion_date - timedelta(days=3)
+    else:
+        # Date the rounds back from the completion date; the validation checks will
+        # quarantine any round that isn't on the expected weekday
+        LOG.warning(
+            "%i %s (%i) didn't finish on Sunday or Monday... it finished on %s",
+            event["calendar_year"],
+            event["event_name"],
+            event["event_id"],
+            completion_date.strftime("%A"),
+        )
+        start_date = completion_date - timedelta(days=4)
     for player in response_.json()["scores"]:
         for i in range(1, 5):  # Each round
             if (round_data := player.get(f"round_{i!s}")) is not None:
@@ -106,23 +141,7 @@ def collect_raw_event_data(event: dict) -> list[ScoreObject]:
                     sg_t2g=round_data.get("sg_t2g"),
                     sg_total=round_data.get("sg_total"),
                 )
-                # Make the assumption that round 1 is always on a Thursday
-                # Account for Monday finishes
-                if completion_date.weekday() == 0:
-                    round_date = completion_date + timedelta(days=i - 5)
-                elif completion_date.weekday() == 6:
-                    round_date = completion_date + timedelta(days=i - 4)
-                elif completion_date.weekday() == 5:
-                    # 54-hole tournament
-                    round_date = completion_date + timedelta(days=i - 3)
-                else:
-                    msg = (
-                        f"{event['calendar_year']} {event['event_name']} ({event['event_id']}) "
-                        f"didn't finish on Sunday or Monday... it finished on {completion_date.strftime('%A')}"
-                    )
-                    raise ValueError(msg)
-                assert round_date.weekday() == i + 2, "Datetime math is bad"
-
+                round_date = start_date + timedelta(days=i)
                 if (teetime := round_data.get("teetime")) is not None:
                     parsed_teetime = datetime.strptime(teetime, "%I:%M%p")
                     obj.teetime = datetime(
@@ -0,0 +1,206 @@
+"""Arrow IPC cache for repeated loads of the scoring data and derived tables."""
+
+import json
+import logging
+import os
+import tempfile
+from collections.abc import Callable, Sequence
+from pathlib import Path
+
+import polars as pl
+
+LOG = logging.getLogger(__name__)
+
+CACHE_DIR = ".cache"
+
+
+def default_cache_path(sources: Path | Sequence[Path]) -> Path:
+    """Get the default cache location for a set of source files.
+
+    Parameters
+    ----------
+    sources : Path or sequence of Path
+        The source file(s). For multiple sources, the cache is named after the closest
+        common directory.
+
+    Returns
+    -------
+    Path
+        The cache file, in a ``.cache`` directory alongside the source(s).
+    """
+    if isinstance(sources, Path):
+        return sources.parent / CACHE_DIR / f"{sources.stem}.arrow"
+    common = Path(os.path.commonpath(sources))
+
+    return common / CACHE_DIR / f"{common.name}.arrow"
+
+
+def _fingerprint(sources: Sequence[Path]) -> list[list]:
+    """Identify the current state of the source files.
+
+    Parameters
+    ----------
+    sources : sequence of Path
+        The source files.
+
+    Returns
+    -------
+    list[list]
+        The name, modification time and size of each source.
+    """
+    out: list[list] = []
+    for fpath in sorted(sources):
+        stat = fpath.stat()
+        out.append([str(fpath.resolve()), stat.st_mtime_ns, stat.st_size])
+
+    return out
+
+
+def _write_atomically(fpath: Path, write: Callable[[Path], None]):
+    """Write a file through a unique temporary file in the same directory.
+
+    Parameters
+    ----------
+    fpath : Path
+        The output file.
+    write : Callable
+        A function that writes to the path it is given.
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=fpath.parent, prefix=f"{fpath.name}.", suffix=".tmp"
+    )
+    os.close(fd)
+    try:
+        write(Path(tmp_path))
+        os.replace(tmp_path, fpath)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def write_cache(
+    data: pl.DataFrame,
+    sources: Path | Sequence[Path],
+    cache_path: Path | None = None,
+    fingerprint: list[list] | None = None,
+):
+    """Write an uncompressed Arrow IPC copy of a dataset.
+
+    The file is uncompressed so that it can be memory-mapped. The state of the source
+    files is recorded in a ``<cache>.json`` manifest to detect stale caches.
+
+    Parameters
+    ----------
+    data : pl.DataFrame
+        The dataset.
+    sources : Path or sequence of Path
+        The source file(s) that ``data`` was read from or written to.
+    cache_path : Path, optional (default None)
+        The cache file. Defaults to :py:meth:`proper_test_index.ipc.default_cache_path`.
+    fingerprint : list[list], optional (default None)
+        The state of the source files from before ``data`` was read. If the sources have
+        changed since, the cache isn't written. Defaults to the current state.
+    """
+    if cache_path is None:
+        cache_path = default_cache_path(sources)
+    if isinstance(sources, Path):
+        sources = [sources]
+    current = _fingerprint(sources)
+    if fingerprint is not None and fingerprint != current:
+        LOG.info("%s changed while reading, not caching", sources)
+        return
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # Replace atomically so open memory maps of the old file stay valid, readers never
+    # see a partial manifest and concurrent writers don't share a temporary file
+    _write_atomically(
+        cache_path, lambda fpath: data.write_ipc(fpath, compression="uncompressed")
+    )
+    _write_atomically(
+        cache_path.with_suffix(".json"),
+        lambda fpath: fpath.write_text(json.dumps(current)),
+    )
+
+
+def read_cache(
+    sources: Path | Sequence[Path],
+    cache_path: Path | None = None,
+    schema: pl.Schema | None = None,
+) -> pl.DataFrame | None:
+    """Read a cached dataset, memory-mapped.
+
+    Parameters
+    ----------
+    sources : Path or sequence of Path
+        The source file(s) for the dataset.
+    cache_path : Path, optional (default None)
+        The cache file. Defaults to :py:meth:`proper_test_index.ipc.default_cache_path`.
+    schema : pl.Schema, optional (default None)
+        The expected schema. A cache with a different schema is considered stale.
+
+    Returns
+    -------
+    pl.DataFrame or None
+        The dataset, or ``None`` if the cache is missing or stale.
+    """
+    if cache_path is None:
+        cache_path = default_cache_path(sources)
+    if isinstance(sources, Path):
+        sources = [sources]
+    manifest = cache_path.with_suffix(".json")
+    if not cache_path.exists() or not manifest.exists():
+        return None
+    with open(manifest) as infile:
+        if json.load(infile) != _fingerprint(sources):
+            LOG.info("%s is stale", cache_path)
+            return None
+    if schema is not None and pl.read_ipc_schema(cache_path) != dict(schema):
+        LOG.info("%s has an outdated schema", cache_path)
+        return None
+
+    return pl.read_ipc(cache_path, memory_map=True)
+
+
+def load_cached(
+    sources: Path | Sequence[Path],
+    schema: pl.Schema | None = None,
+    cache_path: Path | None = None,
+    update_cache: bool = True,
+) -> pl.DataFrame:
+    """Load a dataset from the Arrow IPC cache, falling back to the source files.
+
+    If the cache is missing or stale, the source files are read and, unless
+    ``update_cache`` is ``False``, the cache is rewritten.
+
+    Parameters
+    ----------
+    sources : Path or sequence of Path
+        The source CSV or parquet file(s).
+    schema : pl.Schema, optional (default None)
+        The schema for the dataset, e.g. from :py:meth:`proper_test_index.schemas.to_schema`.
+    cache_path : Path, optional (default None)
+        The cache file. Defaults to :py:meth:`proper_test_index.ipc.default_cache_path`.
+    update_cache : bool, optional (default True)
+        Whether or not to rewrite a missing or stale cache. Read-only consumers should
+        leave the cache to the process that writes the sources.
+
+    Returns
+    -------
+    pl.DataFrame
+        The dataset.
+    """
+    if (data := read_cache(sources, cache_path=cache_path, schema=schema)) is not None:
+        return data
+    files = [sources] if isinstance(sources, Path) else list(sources)
+    fingerprint = _fingerprint(files)
+    if all(fpath.suffix == ".csv" for fpath in files):
+        data = pl.concat([pl.read_csv(fpath, schema=schema) for fpath in files])
+    else:
+        data = pl.scan_parquet(files, schema=schema).collect()
+    if not update_cache:
+        return data
+    try:
+        write_cache(data, sources, cache_path=cache_path, fingerprint=fingerprint)
+    except OSError:
+        LOG.warning("Unable to write the cache for %s", files, exc_info=True)
+
+    return data
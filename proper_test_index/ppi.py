@@ -1,9 +1,37 @@
 """Proper player index."""
 
+import math
+from collections.abc import Iterable
+from datetime import timedelta
+from typing import Literal
+
 import polars as pl
 from polars._typing import FrameType
 
 
+def calc_weighted_differential(
+    score: pl.Expr, wave_average: pl.Expr, course_factor: pl.Expr
+) -> pl.Expr:
+    """Calculate the course factor-weighted score differential for a round.
+
+    Parameters
+    ----------
+    score : pl.Expr
+        An expression that represents the player's round score.
+    wave_average : pl.Expr
+        An expression that represents the scoring average for a given wave (morning or
+        afternoon).
+    course_factor : pl.Expr
+        An expression that represents the course factor.
+
+    Returns
+    -------
+    pl.Expr
+        An expression for the weighted score differential.
+    """
+    return (wave_average - score) * course_factor
+
+
 def calc_ppi(score: pl.Expr, wave_average: pl.Expr, course_factor: pl.Expr) -> pl.Expr:
     """Calculate a weighted average of score differential.
 
@@ -24,33 +52,135 @@ def calc_ppi(score: pl.Expr, wave_average: pl.Expr, course_factor: pl.Expr) -> p
     pl.Expr
         An expression that calculates the proper player index.
     """
-    return ((wave_average - score) * course_factor).sum() / (course_factor.sum())
+    return calc_weighted_differential(score, wave_average, course_factor).sum() / (
+        course_factor.sum()
+    )
 
 
-def gen_rolling_ppi(
-    scoring: FrameType, course_factor: FrameType, period: int = 25
-) -> FrameType:
-    """Pipe-compatible function for calculating a rolling proper player index.
+def calc_ewm_ppi(
+    score: pl.Expr,
+    wave_average: pl.Expr,
+    course_factor: pl.Expr,
+    half_life: float,
+    by: pl.Expr | None = None,
+    elapsed: pl.Expr | None = None,
+) -> pl.Expr:
+    """Calculate an exponentially weighted proper player index.
+
+    Each round is weighted by its course factor and by ``0.5 ** (age / half_life)``, where
+    the age is measured in rounds or, if ``by`` is supplied, in days. The result is
+    equivalent to :py:meth:`proper_test_index.ppi.calc_ppi` with decayed weights, but is
+    computed as a running scan rather than an aggregation. Use with ``.over()`` to
+    calculate the index for each player.
+
+    Parameters
+    ----------
+    score : pl.Expr
+        An expression that represents the player's round score.
+    wave_average : pl.Expr
+        An expression that represents the scoring average for a given wave (morning or
+        afternoon).
+    course_factor : pl.Expr
+        An expression that represents the course factor.
+    half_life : float
+        The half-life, in rounds or days.
+    by : pl.Expr, optional (default None)
+        A datetime expression (e.g. the tee time). If supplied, ``half_life`` is in days.
+    elapsed : pl.Expr, optional (default None)
+        The number of days since the player's previous round, null for their first round.
+        Required if ``by`` is supplied. Every other value must be positive and no value
+        can be null, so rounds with the same tee time must be combined and rounds
+        without a course factor must have a factor of zero.
+
+    Returns
+    -------
+    pl.Expr
+        An expression that calculates the decayed proper player index.
+    """
+    return _calc_decayed_ratio(
+        calc_weighted_differential(score, wave_average, course_factor),
+        course_factor,
+        half_life=half_life,
+        by=by,
+        elapsed=elapsed,
+    )
+
+
+def _calc_decayed_ratio(
+    weighted: pl.Expr,
+    weight: pl.Expr,
+    half_life: float,
+    by: pl.Expr | None = None,
+    elapsed: pl.Expr | None = None,
+) -> pl.Expr:
+    """Calculate the ratio of two exponentially decayed running sums."""
+    if by is None:
+        return weighted.ewm_mean(half_life=half_life) / weight.ewm_mean(
+            half_life=half_life
+        )
+    if elapsed is None:
+        raise ValueError("`elapsed` is required for a time-based half-life.")
+
+    # ``ewm_mean_by`` evaluates y_i = (1 - a_i) * y_{i-1} + a_i * x_i, where a_i depends
+    # on the time since the previous observation. Scaling each input by 1 / a_i turns
+    # this into the decayed running sum y_i = 0.5 ** (dt_i / half_life) * y_{i-1} + x_i.
+    alpha = pl.lit(1.0) - (pl.lit(-math.log(2) / half_life) * elapsed).exp()
+    numerator = pl.when(elapsed.is_null()).then(weighted).otherwise(weighted / alpha)
+    denominator = pl.when(elapsed.is_null()).then(weight).otherwise(weight / alpha)
+    return numerator.ewm_mean_by(
+        by, half_life=timedelta(days=half_life)
+    ) / denominator.ewm_mean_by(by, half_life=timedelta(days=half_life))
+
+
+def join_course_factor(scoring: FrameType, course_factor: FrameType) -> FrameType:
+    """Pipe-compatible function for attaching the course factor to rounds.
 
     Parameters
     ----------
     scoring : dataframe-like
-        A polars dataframe/lazyframe with round-by-round scoring data. The dataframe output
-        from :py:meth:`proper_test_index.collect.collect_raw_event_data`.
+        A polars dataframe/lazyframe with round-by-round scoring data.
     course_factor : dataframe-like
-        A polars dataframe/lazyframe with the course factor and the course number. The output
-        from :py:meth:`proper_player_index.pti.calc_course_factor`.
-    period : int, optional (default 25)
-        The number of rounds to consider in the rolling PTI.
+        A polars dataframe/lazyframe with the course factor and the course number. If it
+        has an ``era`` column, it is joined on the course number and season.
 
     Returns
     -------
     dataframe-like
-        The round-level dataset with a 25-round rolling average proper player index.
+        The round-level dataset with the course factor columns. Rounds on courses without
+        a course factor have null values.
+    """
+    if "era" in course_factor.collect_schema():
+        # Era course factors apply to rounds in the final season of the era
+        return scoring.join(
+            course_factor.rename({"era": "year"}).with_columns(
+                pl.col("year").cast(scoring.collect_schema()["year"])
+            ),
+            on=["course_num", "year"],
+            how="left",
+        )
+
+    return scoring.join(course_factor, on="course_num", how="left")
+
+
+def gen_enriched_rounds(scoring: FrameType, course_factor: FrameType) -> FrameType:
+    """Pipe-compatible function for attaching the course factor and wave average to rounds.
+
+    Parameters
+    ----------
+    scoring : dataframe-like
+        A polars dataframe/lazyframe with round-by-round scoring data.
+    course_factor : dataframe-like
+        A polars dataframe/lazyframe with the course factor and the course number. If it
+        has an ``era`` column, it is joined on the course number and season.
+
+    Returns
+    -------
+    dataframe-like
+        The round-level dataset with ``wave`` and ``wave_average`` columns.
     """
     return (
-        scoring.drop_nulls("score")  # ZURICH
-        .join(course_factor, on="course_num", how="left")
+        join_course_factor(scoring, course_factor)
+        .drop_nulls("score")  # ZURICH
         .with_columns(
             wave=(
                 pl.when(pl.col("teetime").dt.hour() < 12)
@@ -63,6 +193,33 @@ def gen_rolling_ppi(
             .mean()
             .over(["event_id", "year", "round", "wave"])
         )
+    )
+
+
+def gen_rolling_ppi(
+    scoring: FrameType, course_factor: FrameType, period: int = 25
+) -> FrameType:
+    """Pipe-compatible function for calculating a rolling proper player index.
+
+    Parameters
+    ----------
+    scoring : dataframe-like
+        A polars dataframe/lazyframe with round-by-round scoring data. The dataframe output
+        from :py:meth:`proper_test_index.collect.collect_raw_event_data`.
+    course_factor : dataframe-like
+        A polars dataframe/lazyframe with the course factor and the course number. The output
+        from :py:meth:`proper_player_index.pti.calc_course_factor` or
+        :py:meth:`proper_player_index.pti.calc_era_course_factor`.
+    period : int, optional (default 25)
+        The number of rounds to consider in the rolling PTI.
+
+    Returns
+    -------
+    dataframe-like
+        The round-level dataset with a 25-round rolling average proper player index.
+    """
+    return (
+        gen_enriched_rounds(scoring, course_factor)
         .sort("dg_id", "teetime", descending=False)
         .with_row_index()
         .rolling("index", period=f"{period}i", group_by=["dg_id", "player_name"])
@@ -112,3 +269,125 @@ def gen_rolling_ppi(
         )
         .sort("dg_id", "player_name", "teetime", descending=True)
     )
+
+
+def gen_ewm_ppi(
+    scoring: FrameType,
+    course_factor: FrameType,
+    half_life: float | Iterable[float] = 25,
+    unit: Literal["rounds", "days"] = "rounds",
+) -> FrameType:
+    """Pipe-compatible function for calculating an exponentially weighted PPI.
+
+    Unlike :py:meth:`proper_test_index.ppi.gen_rolling_ppi`, every round contributes to
+    the index, with a weight that halves every ``half_life`` rounds or days. The index is
+    a single running scan over each player's rounds, so multiple half-lives are computed
+    from the same pass over the data.
+
+    Parameters
+    ----------
+    scoring : dataframe-like
+        A polars dataframe/lazyframe with round-by-round scoring data. The dataframe output
+        from :py:meth:`proper_test_index.collect.collect_raw_event_data`.
+    course_factor : dataframe-like
+        A polars dataframe/lazyframe with the course factor and the course number. The output
+        from :py:meth:`proper_player_index.pti.calc_course_factor` or
+        :py:meth:`proper_player_index.pti.calc_era_course_factor`.
+    half_life : float or iterable of floats, optional (default 25)
+        The half-life(s). Each value creates a ``ppi_ewm_<half_life>`` column.
+    unit : {"rounds", "days"}, optional (default "rounds")
+        Whether the half-life is measured in rounds played or in days, using ``teetime``.
+        For days, rounds with the same tee time are weighted as if played together.
+
+    Returns
+    -------
+    dataframe-like
+        The round-level dataset with the decayed proper player index as of each round.
+    """
+    if unit not in ("rounds", "days"):
+        raise ValueError(f"`unit` must be 'rounds' or 'days', not '{unit}'.")
+    half_lives = [half_life] if isinstance(half_life, int | float) else list(half_life)
+    if not half_lives or any(value <= 0 for value in half_lives):
+        raise ValueError("Please provide at least one positive half-life.")
+
+    columns = [f"ppi_ewm_{value:g}" for value in half_lives]
+    rounds = (
+        gen_enriched_rounds(scoring, course_factor)
+        .sort("dg_id", "teetime", descending=False)
+        .with_columns(
+            rounds=pl.col("teetime").cum_count().over("dg_id"),
+            # Rounds without a finite course factor carry no weight but still age the
+            # index
+            factor=pl.when(pl.col("course_factor_star").is_finite())
+            .then(pl.col("course_factor_star"))
+            .otherwise(0.0),
+        )
+    )
+    if unit == "rounds":
+        rounds = rounds.with_columns(
+            [
+                calc_ewm_ppi(
+                    pl.col("score"),
+                    pl.col("wave_average"),
+                    pl.col("factor"),
+                    half_life=value,
+                )
+                .over("dg_id")
+                .alias(name)
+                for value, name in zip(half_lives, columns, strict=True)
+            ]
+        )
+    else:
+        # Rounds with the same tee time are combined so that the time between
+        # observations is always positive
+        times = (
+            rounds.group_by("dg_id", "teetime")
+            .agg(
+                weighted=calc_weighted_differential(
+                    pl.col("score"), pl.col("wave_average"), pl.col("factor")
+                ).sum(),
+                factor=pl.col("factor").sum(),
+            )
+            .sort("dg_id", "teetime", descending=False)
+            .with_columns(
+                days_elapsed=(
+                    pl.col("teetime").diff().dt.total_seconds() / 86_400
+                ).over("dg_id")
+            )
+            .with_columns(
+                [
+                    _calc_decayed_ratio(
+                        pl.col("weighted"),
+                        pl.col("factor"),
+                        half_life=value,
+                        by=pl.col("teetime"),
+                        elapsed=pl.col("days_elapsed"),
+                    )
+                    .over("dg_id")
+                    .alias(name)
+                    for value, name in zip(half_lives, columns, strict=True)
+                ]
+            )
+            .select("dg_id", "teetime", *columns)
+        )
+        rounds = rounds.join(times, on=["dg_id", "teetime"], how="left")
+
+    return (
+        # A player has no index until they play a course with a course factor
+        rounds.with_columns(pl.col(columns).fill_nan(None))
+        .select(
+            [
+                "dg_id",
+                "player_name",
+                *columns,
+                "teetime",
+                "rounds",
+                "sg_total",
+                "score",
+                "event_name",
+                "wave_average",
+                "course_factor_star",
+            ]
+        )
+        .sort("dg_id", "player_name", "teetime", descending=True)
+    )
@@ -86,3 +86,101 @@ def calc_course_factor(pti: FrameType) -> FrameType:
         )
         .sort("course_factor", descending=True)
     )
+
+
+def calc_era_course_factor(pti: FrameType, seasons: int = 5) -> FrameType:
+    """Calculate the course factor over sliding windows of seasons.
+
+    Each era ends with a season and covers the ``seasons`` calendar years up to and
+    including it. Courses are only compared against the rest of the field in the same era.
+    The per-season totals are aggregated once and each window is a difference of their
+    cumulative sums.
+
+    Parameters
+    ----------
+    pti : dataframe-like
+        The output from :py:meth:`proper_test_index.pti.calc_pti`.
+    seasons : int, optional (default 5)
+        The number of seasons in each era.
+
+    Returns
+    -------
+    dataframe-like
+        The course/era-level dataset with course factor and log course factor, for each
+        season in which a course was played. The ``era`` column is the final season. The
+        course factor is null for eras in which no other course was played.
+    """
+    if seasons < 1:
+        raise ValueError("Each era must include at least one season.")
+    totals: list[str] = [
+        "total_over_80",
+        "total_sub_70",
+        "total_rounds",
+        "total_strokes",
+    ]
+    season_stats = pti.group_by("course_num", pl.col("year").cast(pl.Int64)).agg(
+        total_over_80=pl.col("over_80").sum(),
+        total_sub_70=pl.col("sub_70").sum(),
+        total_rounds=pl.col("total_rounds").sum(),
+        total_strokes=(pl.col("scoring_average") * pl.col("total_rounds")).sum(),
+    )
+    # Every course needs a row for every season for fixed-size windows
+    grid = pti.select(pl.col("course_num").unique()).join(
+        pti.select(
+            pl.int_range(pl.col("year").min(), pl.col("year").max() + 1).alias("year")
+        ),
+        how="cross",
+    )
+    names = pti.group_by("course_num").agg(course_name=pl.col("course_name").first())
+
+    return (
+        grid.join(season_stats, on=["course_num", "year"], how="left")
+        .with_columns(
+            pl.col(totals).fill_null(0),
+            season_rounds=pl.col("total_rounds").fill_null(0),
+        )
+        .sort("course_num", "year", descending=False)
+        .with_columns(pl.col(totals).cum_sum().over("course_num"))
+        .with_columns(
+            pl.col(totals)
+            - pl.col(totals).shift(seasons, fill_value=0).over("course_num")
+        )
+        .with_columns(
+            other_over_80=pl.col("total_over_80").sum().over("year")
+            - pl.col("total_over_80"),
+            other_sub_70=pl.col("total_sub_70").sum().over("year")
+            - pl.col("total_sub_70"),
+            other_rounds=pl.col("total_rounds").sum().over("year")
+            - pl.col("total_rounds"),
+        )
+        .filter(pl.col("season_rounds") > 0)
+        .join(names, on="course_num", how="left")
+        .select(
+            "course_num",
+            "course_name",
+            pl.col("year").alias("era"),
+            pl.max_horizontal(pl.col("year") - seasons + 1, pl.col("year").min()).alias(
+                "era_start"
+            ),
+            "total_over_80",
+            "total_sub_70",
+            "total_rounds",
+            (pl.col("total_strokes") / pl.col("total_rounds")).alias("scoring_average"),
+            # Without any other course there is no field to compare against
+            *[
+                pl.when(pl.col("other_rounds") > 0).then(pl.col(name)).alias(name)
+                for name in ("other_over_80", "other_sub_70")
+            ],
+        )
+        .with_columns(
+            course_factor=pl.lit(100)
+            * (
+                (pl.col("total_over_80") / pl.col("total_sub_70"))
+                / (pl.col("other_over_80") / pl.col("other_sub_70"))
+            )
+        )
+        .with_columns(
+            course_factor_star=(pl.lit(1.0) + pl.col("course_factor")).log10()
+        )
+        .sort(["era", "course_factor"], descending=[False, True])
+    )
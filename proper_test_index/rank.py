@@ -0,0 +1,100 @@
+"""As-of proper player index rankings."""
+
+from collections.abc import Iterable
+from datetime import date
+
+import polars as pl
+from polars._typing import FrameType
+
+
+def gen_ppi_index(ppi: FrameType) -> FrameType:
+    """Reduce a rolling PPI dataset to one row per player and day.
+
+    A player's rolling PPI only changes when they play a round, so the latest value on
+    each day they played is enough to recover their PPI as of any date.
+
+    Parameters
+    ----------
+    ppi : dataframe-like
+        The output from :py:meth:`proper_test_index.ppi.gen_rolling_ppi`.
+
+    Returns
+    -------
+    dataframe-like
+        The rolling PPI with a ``date`` column, sorted by date.
+    """
+    return (
+        ppi.sort("dg_id", "teetime", descending=False)
+        .with_columns(date=pl.col("teetime").dt.date())
+        .group_by("dg_id", "date", maintain_order=True)
+        .last()
+        .sort("date", "dg_id", descending=False)
+    )
+
+
+def gen_ppi_rankings(
+    ppi: FrameType,
+    dates: Iterable[date],
+    max_days: int | None = 730,
+    max_inactive_days: int | None = 365,
+) -> FrameType:
+    """Rank every active player by proper player index as of each date.
+
+    Parameters
+    ----------
+    ppi : dataframe-like
+        The output from :py:meth:`proper_test_index.ppi.gen_rolling_ppi`, or the output from
+        :py:meth:`proper_test_index.rank.gen_ppi_index` to reuse the index across calls.
+    dates : iterable of dates
+        The as-of dates. Rounds played on a date are included in its rankings.
+    max_days : int, optional (default 730)
+        The maximum number of days spanned by a player's rolling window. Players whose
+        window is longer aren't ranked. Use ``None`` to rank every player.
+    max_inactive_days : int, optional (default 365)
+        Players without a round in this many days before the as-of date aren't ranked.
+        Use ``None`` to rank inactive players.
+
+    Returns
+    -------
+    dataframe-like
+        One row per ranked player and as-of date with the player's latest rolling PPI, the
+        ``rank`` (1 is the best) and ``percentile`` within the date and the number of
+        ranked ``players``. Players whose latest PPI isn't finite aren't ranked.
+    """
+    if "date" not in ppi.collect_schema():
+        ppi = gen_ppi_index(ppi)
+    as_of = pl.LazyFrame({"as_of": list(dates)}, schema={"as_of": pl.Date})
+    grid = (
+        ppi.lazy()
+        .select(pl.col("dg_id").unique())
+        .join(as_of, how="cross")
+        .sort("as_of", "dg_id", descending=False)
+    )
+    out = (
+        grid.join_asof(
+            ppi.lazy().sort("date", descending=False),
+            left_on="as_of",
+            right_on="date",
+            by="dg_id",
+            strategy="backward",
+            tolerance=(None if max_inactive_days is None else f"{max_inactive_days}d"),
+            # Sorted above; polars can't check sortedness within the ``by`` groups
+            check_sortedness=False,
+        )
+        .drop_nulls("date")
+        .drop("date")
+        # Polars sorts NaN above every number
+        .filter(pl.col("ppi").is_finite())
+    )
+    if max_days is not None:
+        out = out.filter(
+            (pl.col("teetime") - pl.col("first_tee_time_in_group")).dt.total_days()
+            <= max_days
+        )
+    out = out.with_columns(
+        rank=pl.col("ppi").rank("min", descending=True).over("as_of"),
+        percentile=(pl.lit(100.0) * pl.col("ppi").rank("max") / pl.len()).over("as_of"),
+        players=pl.len().over("as_of"),
+    ).sort("as_of", "rank", "dg_id", descending=False)
+
+    return out if isinstance(ppi, pl.LazyFrame) else out.collect()
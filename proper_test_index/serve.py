@@ -0,0 +1,392 @@
+"""Read-only query service for the PTI and PPI outputs."""
+
+import asyncio
+import json
+import logging
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from http import HTTPStatus
+from pathlib import Path
+from urllib.parse import parse_qsl, urlsplit
+
+import polars as pl
+from attrs import define, field
+
+from proper_test_index.ipc import load_cached
+
+LOG = logging.getLogger(__name__)
+
+ARTIFACTS: dict[str, str] = {
+    "pti": "pti.csv",
+    "course_factor": "course_factor.csv",
+    "ppi": "data/ppi-rolling-50.parquet",
+}
+
+
+@define
+class ArtifactStore:
+    """Load the aggregated outputs once and reload them when they change.
+
+    Parameters
+    ----------
+    root : Path
+        The directory containing the ``aggregate.py`` outputs.
+    paths : dict[str, str], optional
+        The location of each artifact, relative to ``root``.
+    """
+
+    root: Path
+    paths: dict[str, str] = field(factory=lambda: dict(ARTIFACTS))
+    version: tuple = field(init=False, default=())
+    frames: dict[str, pl.DataFrame] = field(init=False, factory=dict)
+
+    def current_version(self) -> tuple:
+        """Get the modification time and size of every artifact.
+
+        Returns
+        -------
+        tuple
+            An identifier that changes whenever an artifact is rewritten.
+        """
+        out: list[tuple[str, int, int]] = []
+        for name, path in sorted(self.paths.items()):
+            stat = (self.root / path).stat()
+            out.append((name, stat.st_mtime_ns, stat.st_size))
+
+        return tuple(out)
+
+    def refresh(self) -> bool:
+        """Reload the artifacts if they have changed on disk.
+
+        Returns
+        -------
+        bool
+            Whether or not the artifacts were reloaded.
+        """
+        version = self.current_version()
+        if version == self.version:
+            return False
+        LOG.info("Loading artifacts from %s", self.root)
+        self.frames = {
+            # ``aggregate`` owns the cache, so don't race it to rewrite a stale one
+            name: load_cached(self.root / path, update_cache=False)
+            for name, path in self.paths.items()
+        }
+        self.version = version
+
+        return True
+
+
+@define
+class QueryCache:
+    """Least-recently-used cache for query results.
+
+    Parameters
+    ----------
+    maxsize : int, optional (default 256)
+        The maximum number of results to keep.
+    """
+
+    maxsize: int = 256
+    hits: int = field(init=False, default=0)
+    misses: int = field(init=False, default=0)
+    _data: OrderedDict = field(init=False, factory=OrderedDict)
+    _lock: threading.Lock = field(init=False, factory=threading.Lock)
+
+    def get(self, key: tuple, func: Callable[[], pl.DataFrame]) -> pl.DataFrame:
+        """Get a cached result, computing it if necessary.
+
+        Parameters
+        ----------
+        key : tuple
+            The cache key. Should include the artifact version.
+        func : Callable
+            A function that computes the result.
+
+        Returns
+        -------
+        pl.DataFrame
+            The query result.
+        """
+        with self._lock:
+            if key in self._data:
+                self.hits += 1
+                self._data.move_to_end(key)
+                return self._data[key]
+            self.misses += 1
+        result = func()
+        with self._lock:
+            self._data[key] = result
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+        return result
+
+    def clear(self):
+        """Remove all cached results."""
+        with self._lock:
+            self._data.clear()
+
+
+def query_course_factor(
+    frames: dict[str, pl.DataFrame], course_num: int | None = None
+) -> pl.DataFrame:
+    """Get the course factor, optionally for a single course.
+
+    Parameters
+    ----------
+    frames : dict[str, pl.DataFrame]
+        The loaded artifacts.
+    course_num : int, optional (default None)
+        The course number.
+
+    Returns
+    -------
+    pl.DataFrame
+        The course factor dataset.
+    """
+    out = frames["course_factor"]
+    if course_num is not None:
+        out = out.filter(pl.col("course_num") == course_num)
+
+    return out
+
+
+def query_pti(
+    frames: dict[str, pl.DataFrame],
+    event_id: int | None = None,
+    year: int | None = None,
+    majors: bool = False,
+) -> pl.DataFrame:
+    """Get the proper test index by event.
+
+    Parameters
+    ----------
+    frames : dict[str, pl.DataFrame]
+        The loaded artifacts.
+    event_id : int, optional (default None)
+        The event ID.
+    year : int, optional (default None)
+        The calendar year.
+    majors : bool, optional (default False)
+        Whether or not to only include major championships.
+
+    Returns
+    -------
+    pl.DataFrame
+        The event-level proper test index.
+    """
+    out = frames["pti"]
+    if event_id is not None:
+        out = out.filter(pl.col("event_id") == event_id)
+    if year is not None:
+        out = out.filter(pl.col("year") == year)
+    if majors:
+        out = out.filter(pl.col("major_championship"))
+
+    return out
+
+
+def query_player(frames: dict[str, pl.DataFrame], dg_id: int) -> pl.DataFrame:
+    """Get the proper player index history for a player.
+
+    Parameters
+    ----------
+    frames : dict[str, pl.DataFrame]
+        The loaded artifacts.
+    dg_id : int
+        The Data Golf player ID.
+
+    Returns
+    -------
+    pl.DataFrame
+        The player's rolling proper player index, most recent round first.
+    """
+    return (
+        frames["ppi"].filter(pl.col("dg_id") == dg_id).sort("teetime", descending=True)
+    )
+
+
+def query_leaderboard(
+    frames: dict[str, pl.DataFrame], limit: int = 50, max_days: int = 730
+) -> pl.DataFrame:
+    """Get the current proper player index leaderboard.
+
+    Parameters
+    ----------
+    frames : dict[str, pl.DataFrame]
+        The loaded artifacts.
+    limit : int, optional (default 50)
+        The number of players to return.
+    max_days : int, optional (default 730)
+        The maximum number of days spanned by a player's rolling window.
+
+    Returns
+    -------
+    pl.DataFrame
+        The latest proper player index for each active player, best first.
+    """
+    ppi = frames["ppi"]
+    latest = ppi.select(pl.col("teetime").max()).item()
+    if latest is None:
+        return ppi.clear()
+
+    return (
+        ppi.sort("dg_id", "teetime", descending=False)
+        .group_by("dg_id")
+        .last()
+        .filter(
+            pl.col("teetime").dt.year() == latest.year,
+            (pl.col("teetime") - pl.col("first_tee_time_in_group")).dt.total_days()
+            <= max_days,
+        )
+        .sort("ppi", descending=True)
+        .head(limit)
+    )
+
+
+ROUTES: dict[str, tuple[Callable[..., pl.DataFrame], dict[str, Callable]]] = {
+    "/course-factor": (query_course_factor, {"course_num": int}),
+    "/pti": (
+        query_pti,
+        {"event_id": int, "year": int, "majors": lambda x: x.lower() == "true"},
+    ),
+    "/player": (query_player, {"dg_id": int}),
+    "/leaderboard": (query_leaderboard, {"limit": int, "max_days": int}),
+}
+
+
+@define
+class QueryService:
+    """Asyncio HTTP service for the aggregated outputs.
+
+    Parameters
+    ----------
+    store : ArtifactStore
+        The artifact store.
+    cache : QueryCache, optional
+        The result cache.
+    poll_interval : float, optional (default 5.0)
+        The number of seconds between checks for new artifacts.
+    """
+
+    store: ArtifactStore
+    cache: QueryCache = field(factory=QueryCache)
+    poll_interval: float = 5.0
+
+    def query(self, path: str, params: dict[str, str]) -> pl.DataFrame:
+        """Run a query against the loaded artifacts.
+
+        Parameters
+        ----------
+        path : str
+            The endpoint, e.g. ``/pti``.
+        params : dict[str, str]
+            The raw query string parameters.
+
+        Returns
+        -------
+        pl.DataFrame
+            The query result.
+
+        Raises
+        ------
+        ValueError
+            Raised if a parameter is unknown or invalid.
+        """
+        if path not in ROUTES:
+            raise ValueError(f"Unknown endpoint: {path}")
+        func, converters = ROUTES[path]
+        unknown = set(params) - set(converters)
+        if unknown:
+            raise ValueError(f"Unknown parameter(s): {', '.join(sorted(unknown))}")
+        kwargs = {key: converters[key](value) for key, value in params.items()}
+        key = (self.store.version, path, tuple(sorted(kwargs.items())))
+
+        return self.cache.get(key, lambda: func(self.store.frames, **kwargs))
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Handle a single HTTP request.
+
+        Parameters
+        ----------
+        reader : asyncio.StreamReader
+            The request stream.
+        writer : asyncio.StreamWriter
+            The response stream.
+        """
+        status = HTTPStatus.OK
+        try:
+            method, target, _ = (await reader.readline()).decode().split(" ", 2)
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                continue
+            url = urlsplit(target)
+            if method != "GET":
+                status = HTTPStatus.METHOD_NOT_ALLOWED
+                body = json.dumps({"error": "Method not allowed"})
+            elif url.path not in ROUTES:
+                status, body = HTTPStatus.NOT_FOUND, json.dumps({"error": "Not found"})
+            else:
+                result = await asyncio.to_thread(
+                    self.query, url.path, dict(parse_qsl(url.query))
+                )
+                body = result.write_json()
+        except (TypeError, ValueError) as exc:
+            status, body = HTTPStatus.BAD_REQUEST, json.dumps({"error": str(exc)})
+        except Exception:
+            # Includes ``pl.exceptions.PolarsError``; always send a response
+            LOG.exception("Unable to handle request")
+            status = HTTPStatus.INTERNAL_SERVER_ERROR
+            body = json.dumps({"error": "Internal server error"})
+        payload = body.encode()
+        writer.write(
+            (
+                f"HTTP/1.1 {status.value} {status.phrase}\r\n"
+                "Content-Type: application/json\r\n"
+                f"Content-Length: {len(payload)}\r\n"
+                "Connection: close\r\n\r\n"
+            ).encode()
+            + payload
+        )
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    async def watch(self):
+        """Poll the artifacts and reload them when ``aggregate.py`` rewrites them."""
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                reloaded = await asyncio.to_thread(self.store.refresh)
+            except (OSError, pl.exceptions.PolarsError):
+                # The artifacts might be partially written
+                LOG.warning("Unable to reload artifacts, retrying...", exc_info=True)
+                continue
+            if reloaded:
+                self.cache.clear()
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8000):
+        """Serve queries until cancelled.
+
+        Parameters
+        ----------
+        host : str, optional (default "127.0.0.1")
+            The host to bind.
+        port : int, optional (default 8000)
+            The port to bind.
+        """
+        self.store.refresh()
+        server = await asyncio.start_server(self.handle, host, port)
+        LOG.info("Serving on %s:%i", host, port)
+        watcher = asyncio.create_task(self.watch())
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            watcher.cancel()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    asyncio.run(QueryService(ArtifactStore(Path.cwd())).serve())
@@ -0,0 +1,148 @@
+"""Dataset-level validation for the scoring data."""
+
+import logging
+from pathlib import Path
+
+import polars as pl
+from attrs import define
+from polars._typing import FrameType
+
+LOG = logging.getLogger(__name__)
+
+ROUND_KEYS: list[str] = ["dg_id", "year", "event_id", "round"]
+EVENT_KEYS: list[str] = ["dg_id", "year", "event_id"]
+
+
+def gen_checks(min_to_par: int = -15, max_to_par: int = 30) -> dict[str, pl.Expr]:
+    """Generate the data quality checks.
+
+    Each check is a boolean expression that is ``True`` for an invalid round.
+
+    Parameters
+    ----------
+    min_to_par : int, optional (default -15)
+        The lowest plausible score relative to par.
+    max_to_par : int, optional (default 30)
+        The highest plausible score relative to par.
+
+    Returns
+    -------
+    dict[str, pl.Expr]
+        The checks, by name.
+    """
+    to_par = pl.col("score") - pl.col("course_par")
+
+    return {
+        # Keep the first copy of a duplicated round
+        "duplicate_round": pl.int_range(pl.len()).over(ROUND_KEYS) > 0,
+        "null_score": pl.col("score").is_null(),
+        "impossible_score": (~to_par.is_between(min_to_par, max_to_par)).fill_null(
+            False
+        ),
+        "null_teetime": pl.col("teetime").is_null(),
+        # Round 1 is on a Thursday
+        "round_weekday": (
+            pl.col("teetime").dt.weekday() != pl.col("round") + 3
+        ).fill_null(False),
+        "round_order": (
+            pl.col("teetime").rank("ordinal").over(EVENT_KEYS)
+            != pl.col("round").rank("ordinal").over(EVENT_KEYS)
+        ).fill_null(False),
+    }
+
+
+def flag_invalid_rounds(
+    scoring: FrameType, min_to_par: int = -15, max_to_par: int = 30
+) -> FrameType:
+    """Pipe-compatible function for flagging invalid rounds.
+
+    Parameters
+    ----------
+    scoring : dataframe-like
+        A polars dataframe/lazyframe with round-by-round scoring data. The dataframe output
+        from :py:meth:`proper_test_index.collect.collect_raw_event_data`.
+    min_to_par : int, optional (default -15)
+        The lowest plausible score relative to par.
+    max_to_par : int, optional (default 30)
+        The highest plausible score relative to par.
+
+    Returns
+    -------
+    dataframe-like
+        The scoring data with a boolean ``invalid_<check>`` column for each check and an
+        ``is_valid`` column.
+    """
+    checks = gen_checks(min_to_par=min_to_par, max_to_par=max_to_par)
+
+    return scoring.with_columns(
+        [expr.alias(f"invalid_{name}") for name, expr in checks.items()]
+    ).with_columns(
+        is_valid=~pl.any_horizontal([f"invalid_{name}" for name in checks]),
+    )
+
+
+@define(auto_attribs=True)
+class ValidationReport:
+    """Summary of the scoring data validation."""
+
+    total_rounds: int
+    invalid_rounds: int
+    failures: dict[str, int]
+
+    @property
+    def is_valid(self) -> bool:
+        """Whether or not every round passed validation."""
+        return self.invalid_rounds == 0
+
+
+def validate_scoring(
+    scoring: FrameType,
+    quarantine_path: Path | None = None,
+    min_to_par: int = -15,
+    max_to_par: int = 30,
+) -> tuple[pl.DataFrame, ValidationReport]:
+    """Validate the scoring data and separate the invalid rounds.
+
+    Parameters
+    ----------
+    scoring : dataframe-like
+        A polars dataframe/lazyframe with round-by-round scoring data.
+    quarantine_path : Path, optional (default None)
+        If provided, invalid rounds and their failed checks are written to this parquet
+        file. The file is empty if every round is valid.
+    min_to_par : int, optional (default -15)
+        The lowest plausible score relative to par.
+    max_to_par : int, optional (default 30)
+        The highest plausible score relative to par.
+
+    Returns
+    -------
+    pl.DataFrame
+        The valid rounds.
+    ValidationReport
+        The number of rounds that failed each check.
+    """
+    flagged = flag_invalid_rounds(
+        scoring.lazy(), min_to_par=min_to_par, max_to_par=max_to_par
+    ).collect()
+    flag_cols = [col for col in flagged.columns if col.startswith("invalid_")]
+    counts = flagged.select(
+        pl.len().alias("total_rounds"),
+        (~pl.col("is_valid")).sum().alias("invalid_rounds"),
+        *[pl.col(col).sum().alias(col.removeprefix("invalid_")) for col in flag_cols],
+    ).row(0, named=True)
+    report = ValidationReport(
+        total_rounds=counts.pop("total_rounds"),
+        invalid_rounds=counts.pop("invalid_rounds"),
+        failures=counts,
+    )
+    for name, count in report.failures.items():
+        if count > 0:
+            LOG.warning("%i round(s) failed the '%s' check", count, name)
+
+    if quarantine_path is not None:
+        flagged.filter(~pl.col("is_valid")).drop("is_valid").write_parquet(
+            quarantine_path, use_pyarrow=True
+        )
+
+    return flagged.filter(pl.col("is_valid")).drop([*flag_cols, "is_valid"]), report
@@ -0,0 +1,128 @@
+"""Test the PPI backtests."""
+
+from datetime import datetime, timedelta
+
+import polars as pl
+import pytest
+from polars.testing import assert_series_equal
+
+from proper_test_index.backtest import backtest_ppi, gen_ppi_predictions
+from proper_test_index.ppi import gen_rolling_ppi
+
+SCORING = pl.DataFrame(
+    [
+        {
+            "year": 2021,
+            "event_id": idx // 4,
+            "event_name": f"event-{idx // 4}",
+            "round": 1 + idx % 4,
+            "course_num": idx % 3,
+            "dg_id": dg_id,
+            "player_name": f"player-{dg_id}",
+            "score": 64 + (idx * 7 + dg_id * 3) % 13,
+            "sg_total": 0.0,
+            "teetime": datetime(2021, 1, 7, 7 + dg_id)
+            + timedelta(days=7 * (idx // 4) + idx % 4),
+        }
+        for idx in range(12)
+        for dg_id in range(3)
+    ]
+)
+COURSE_FACTOR = pl.DataFrame(
+    {"course_num": [0, 1, 2], "course_factor_star": [1.0, 2.0, 0.5]}
+)
+
+
+def test_gen_ppi_predictions():
+    """Test pairing rolling PPI predictions with future performance."""
+    out = gen_ppi_predictions(
+        SCORING, COURSE_FACTOR, periods=[2, 4], half_lives=[3], horizon=3
+    ).sort("method", "parameter", "dg_id", "teetime")
+
+    # Rounds 4 through 9 for each player
+    counts = out.group_by("method", "parameter").len()
+    assert counts["len"].to_list() == [18, 18, 18]
+
+    rolling = gen_rolling_ppi(SCORING, COURSE_FACTOR, period=4)
+    expected = out.filter(pl.col("method") == "rolling", pl.col("parameter") == 4)
+    assert_series_equal(
+        expected["prediction"],
+        expected.join(rolling, on=["dg_id", "teetime"], how="left")["ppi"],
+        check_names=False,
+    )
+
+    # The target is the PPI over the next 3 rounds
+    future = gen_rolling_ppi(SCORING, COURSE_FACTOR, period=3)
+    teetimes = SCORING.group_by("dg_id").agg(pl.col("teetime").sort())
+    lookup = dict(zip(teetimes["dg_id"], teetimes["teetime"].to_list(), strict=True))
+    targets = [
+        future.filter(
+            pl.col("dg_id") == dg_id,
+            pl.col("teetime") == lookup[dg_id][lookup[dg_id].index(tee) + 3],
+        )["ppi"].item()
+        for dg_id, tee in expected.select("dg_id", "teetime").iter_rows()
+    ]
+    assert_series_equal(expected["target"], pl.Series("target", targets))
+
+    # A shared reference weights the target for other course factors
+    flat = gen_ppi_predictions(
+        SCORING,
+        COURSE_FACTOR.with_columns(course_factor_star=0.5),
+        periods=[2, 4],
+        half_lives=[3],
+        horizon=3,
+        reference=COURSE_FACTOR,
+    ).sort("method", "parameter", "dg_id", "teetime")
+    assert_series_equal(flat["target"], out["target"])
+
+
+def test_gen_ppi_predictions_non_finite():
+    """Test that a non-finite course factor doesn't drop a player's later rounds."""
+    expected = gen_ppi_predictions(
+        SCORING, COURSE_FACTOR, periods=[2, 4], half_lives=[3], horizon=3
+    )
+    out = gen_ppi_predictions(
+        SCORING,
+        COURSE_FACTOR.with_columns(
+            course_factor_star=pl.when(pl.col("course_num") == 2)
+            .then(float("nan"))
+            .otherwise(pl.col("course_factor_star"))
+        ),
+        periods=[2, 4],
+        half_lives=[3],
+        horizon=3,
+    )
+
+    assert out.height == expected.height
+    assert out["prediction"].is_finite().all()
+
+
+def test_backtest_ppi():
+    """Test summarizing the backtest for multiple course factor variants."""
+    out = backtest_ppi(
+        SCORING.lazy(),
+        {
+            "pooled": COURSE_FACTOR,
+            "flat": COURSE_FACTOR.with_columns(course_factor_star=1.0),
+        },
+        periods=[2, 4],
+        half_lives=[1, 3],
+        horizon=3,
+    )
+
+    assert out.height == 8
+    assert set(out["course_factor"]) == {"pooled", "flat"}
+    assert out["rounds"].to_list() == [18] * 8
+    assert out["correlation"].is_between(-1, 1).all()
+    assert (out["rmse"] >= out["mae"]).all()
+
+    with pytest.raises(ValueError):
+        backtest_ppi(SCORING, {"pooled": COURSE_FACTOR}, reference="era-5")
+
+
+def test_gen_ppi_predictions_invalid():
+    """Test parameter validation."""
+    with pytest.raises(ValueError):
+        gen_ppi_predictions(SCORING, COURSE_FACTOR, periods=[], half_lives=[])
+    with pytest.raises(ValueError):
+        gen_ppi_predictions(SCORING, COURSE_FACTOR, horizon=0)
@@ -0,0 +1,113 @@
+"""Test the command line interface."""
+
+import subprocess
+import sys
+from datetime import datetime, timedelta
+
+import polars as pl
+
+from proper_test_index.cli import main
+from proper_test_index.schemas import ScoreObject, to_schema
+
+HEAVY_MODULES = ["polars", "requests", "urllib3", "pyarrow"]
+
+
+def test_startup():
+    """Test that ``--help`` doesn't import heavy dependencies."""
+    script = (
+        "import sys, time\n"
+        "start = time.perf_counter()\n"
+        "from proper_test_index.cli import main\n"
+        "try:\n"
+        "    main(['--help'])\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(time.perf_counter() - start)\n"
+        f"print(','.join(mod for mod in {HEAVY_MODULES!r} if mod in sys.modules))\n"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    *_, elapsed, loaded = out.stdout.splitlines()
+
+    assert loaded == ""
+    assert float(elapsed) < 0.5
+
+
+def test_aggregate_and_snapshot(tmp_path):
+    """Test running the aggregation and snapshot commands."""
+    data_dir = tmp_path / "data"
+    (data_dir / "2025").mkdir(parents=True)
+    rounds = [
+        {
+            "year": 2025,
+            "event_id": 1 + idx // 4,
+            "event_name": f"event-{idx // 4}",
+            "dg_id": dg_id,
+            "player_name": f"player-{dg_id}",
+            "round": 1 + idx % 4,
+            "course_name": f"course-{idx // 4}",
+            "course_num": idx // 4,
+            "course_par": 72,
+            "score": 66 + (idx * dg_id) % 16,
+            "sg_total": 0.0,
+            "teetime": datetime(2025, 1, 2, 8 + dg_id)
+            + timedelta(days=7 * (idx // 4) + idx % 4),
+        }
+        for idx in range(8)
+        for dg_id in (1, 2)
+    ]
+    pl.DataFrame(rounds, schema=to_schema(ScoreObject)).write_parquet(
+        data_dir / "2025" / "event-scoring-data.parquet"
+    )
+
+    main(
+        [
+            "aggregate",
+            "--data-dir",
+            str(data_dir),
+            "--output-dir",
+            str(tmp_path),
+            "--period",
+            "2",
+        ]
+    )
+    assert (tmp_path / "pti.csv").exists()
+    assert (tmp_path / "course_factor.csv").exists()
+    assert pl.read_parquet(data_dir / "ppi-ewm.parquet").height == 16
+    assert (data_dir / ".cache" / "scoring-data.arrow").exists()
+    assert (tmp_path / ".cache" / "pti.arrow").exists()
+
+    main(
+        [
+            "snapshot",
+            "--data-dir",
+            str(data_dir),
+            "--output-dir",
+            str(tmp_path),
+            "--period",
+            "2",
+            "--dg-id",
+            "1",
+        ]
+    )
+    assert sorted(pl.read_csv(tmp_path / "ppi-curr.csv")["dg_id"]) == [1, 2]
+    assert pl.read_csv(tmp_path / "ppi-1.csv").height == 7
+    assert not (tmp_path / "ppi-jt.csv").exists()
+
+    main(
+        [
+            "backtest",
+            "--data-dir",
+            str(data_dir),
+            "--output-dir",
+            str(tmp_path),
+            "--period",
+            "2",
+            "--half-life",
+            "2",
+            "--horizon",
+            "2",
+        ]
+    )
+    assert "correlation" in pl.read_csv(tmp_path / "backtest.csv").columns
@@ -6,8 +6,12 @@ from datetime import datetime
 from pathlib import Path
 from unittest.mock import Mock, patch
 
+import polars as pl
+from attrs import asdict
+
 from proper_test_index.collect import collect_raw_event_data, retrieve_event_list
-from proper_test_index.schemas import ScoreObject
+from proper_test_index.schemas import ScoreObject, to_schema
+from proper_test_index.validate import validate_scoring
 
 CURR_DIR = Path(__file__).resolve().parent
 
@@ -135,3 +139,31 @@ def test_retrieve_raw_event_data(mock_req):
         )
         == expected
     )
+
+
+@patch("requests.Session.get")
+def test_retrieve_raw_event_data_weekday(mock_req):
+    """Test that rounds for a non-Sunday/Monday finish are dated and quarantined."""
+    with open(CURR_DIR / "data" / "scoring.json") as infile:
+        api_data = json.load(infile)
+    api_data["event_completed"] = "2021-06-22"  # Tuesday
+    mock_req.return_value = Mock(status_code=200, json=lambda: api_data)
+
+    out = collect_raw_event_data(
+        {
+            "calendar_year": 2021,
+            "date": "2021-06-22",
+            "event_id": 535,
+            "event_name": "U.S. Open",
+            "sg_categories": "yes",
+            "traditional_stats": "yes",
+            "tour": "pga",
+        }
+    )
+    assert [obj.teetime.day for obj in out] == [19, 20, 21, 22]
+
+    valid, report = validate_scoring(
+        pl.DataFrame([asdict(obj) for obj in out], schema=to_schema(ScoreObject))
+    )
+    assert valid.is_empty()
+    assert report.failures["round_weekday"] == 4
@@ -0,0 +1,106 @@
+"""Test the Arrow IPC cache."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from proper_test_index.ipc import (
+    _fingerprint,
+    default_cache_path,
+    load_cached,
+    read_cache,
+    write_cache,
+)
+
+DATA = pl.DataFrame({"course_num": [1, 2], "course_factor": [10.0, 100.0]})
+
+
+def test_default_cache_path(tmp_path):
+    """Test the default cache locations."""
+    assert default_cache_path(tmp_path / "pti.csv") == tmp_path / ".cache" / "pti.arrow"
+    assert (
+        default_cache_path(
+            [tmp_path / "2021" / "a.parquet", tmp_path / "2022" / "b.parquet"]
+        )
+        == tmp_path / ".cache" / f"{tmp_path.name}.arrow"
+    )
+
+
+def test_load_cached(tmp_path):
+    """Test loading through the cache."""
+    source = tmp_path / "course_factor.csv"
+    DATA.write_csv(source)
+    assert read_cache(source) is None
+
+    assert_frame_equal(load_cached(source), DATA)
+    assert (tmp_path / ".cache" / "course_factor.arrow").exists()
+    assert_frame_equal(read_cache(source), DATA)
+
+    # Schema changes invalidate the cache
+    schema = pl.Schema({"course_num": pl.Int32, "course_factor": pl.Float64})
+    assert read_cache(source, schema=schema) is None
+    assert load_cached(source, schema=schema).schema == schema
+    assert read_cache(source, schema=schema) is not None
+
+    # Rewriting the source invalidates the cache
+    DATA.head(1).write_csv(source)
+    os.utime(source, ns=(0, 0))
+    assert read_cache(source, schema=schema) is None
+    assert load_cached(source, schema=schema).height == 1
+
+
+def test_write_cache_changed(tmp_path):
+    """Test that the cache isn't written if the source changed while reading."""
+    source = tmp_path / "course_factor.csv"
+    DATA.write_csv(source)
+    fingerprint = _fingerprint([source])
+    DATA.head(1).write_csv(source)
+    os.utime(source, ns=(0, 0))
+
+    write_cache(DATA, source, fingerprint=fingerprint)
+    assert not (tmp_path / ".cache" / "course_factor.arrow").exists()
+
+    write_cache(DATA.head(1), source, fingerprint=_fingerprint([source]))
+    assert_frame_equal(read_cache(source), DATA.head(1))
+    assert sorted(fpath.name for fpath in (tmp_path / ".cache").iterdir()) == [
+        "course_factor.arrow",
+        "course_factor.json",
+    ]
+
+
+def test_write_cache_concurrent(tmp_path):
+    """Test that concurrent writers don't share temporary files."""
+    source = tmp_path / "course_factor.csv"
+    DATA.write_csv(source)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: write_cache(DATA, source), range(16)))
+    assert_frame_equal(read_cache(source), DATA)
+    assert sorted(fpath.name for fpath in (tmp_path / ".cache").iterdir()) == [
+        "course_factor.arrow",
+        "course_factor.json",
+    ]
+
+
+def test_load_cached_read_only(tmp_path):
+    """Test loading without updating the cache."""
+    source = tmp_path / "course_factor.csv"
+    DATA.write_csv(source)
+
+    assert_frame_equal(load_cached(source, update_cache=False), DATA)
+    assert not (tmp_path / ".cache").exists()
+
+
+def test_load_cached_parquet(tmp_path):
+    """Test loading multiple parquet files through the cache."""
+    for idx in range(2):
+        (tmp_path / str(idx)).mkdir()
+        DATA.slice(idx, 1).write_parquet(tmp_path / str(idx) / "data.parquet")
+    sources = sorted(tmp_path.glob("**/*.parquet"))
+    cache_path = tmp_path / "cache" / "data.arrow"
+
+    assert_frame_equal(load_cached(sources, cache_path=cache_path), DATA)
+    assert_frame_equal(read_cache(sources, cache_path=cache_path), DATA)
+    assert read_cache(sources[:1], cache_path=cache_path) is None
@@ -0,0 +1,214 @@
+"""Test PPI calculations."""
+
+from datetime import datetime, timedelta
+
+import polars as pl
+import pytest
+from polars.testing import assert_series_equal
+
+from proper_test_index.ppi import gen_ewm_ppi, gen_rolling_ppi
+
+SCORING = pl.DataFrame(
+    {
+        "year": 2021,
+        "event_id": [1, 1, 2, 2, 1, 1, 2, 2],
+        "event_name": ["one", "one", "two", "two", "one", "one", "two", "two"],
+        "round": [1, 2, 1, 2, 1, 2, 1, 2],
+        "course_num": [1, 1, 2, 2, 1, 1, 2, 2],
+        "dg_id": [1, 1, 1, 1, 2, 2, 2, 2],
+        "player_name": ["a", "a", "a", "a", "b", "b", "b", "b"],
+        "score": [70, 72, 68, 75, 74, 70, 72, 69],
+        "sg_total": [1.0, -1.0, 2.0, -2.0, -1.0, 1.0, 0.0, 1.5],
+        "teetime": [
+            datetime(2021, 1, 7, 8),
+            datetime(2021, 1, 8, 8),
+            datetime(2021, 3, 4, 8),
+            datetime(2021, 3, 5, 8),
+        ]
+        * 2,
+    }
+)
+COURSE_FACTOR = pl.DataFrame({"course_num": [1, 2], "course_factor_star": [1.0, 2.0]})
+
+
+def _expected(ages: list[float], half_life: float) -> list[float]:
+    """Brute-force the decayed PPI for player ``a``."""
+    diffs = [2.0, -1.0, 2.0, -3.0]
+    factors = [1.0, 1.0, 2.0, 2.0]
+    out: list[float] = []
+    for idx in range(len(ages)):
+        weights = [
+            0.5 ** ((ages[idx] - ages[prev]) / half_life) * factors[prev]
+            for prev in range(idx + 1)
+        ]
+        out.append(
+            sum(w * d for w, d in zip(weights, diffs, strict=False)) / sum(weights)
+        )
+
+    return out
+
+
+def test_gen_ewm_ppi_rounds():
+    """Test the decayed PPI with a half-life in rounds."""
+    out = gen_ewm_ppi(SCORING, COURSE_FACTOR, half_life=[1, 2.5]).sort(
+        "dg_id", "teetime"
+    )
+
+    assert out.columns[:4] == ["dg_id", "player_name", "ppi_ewm_1", "ppi_ewm_2.5"]
+    player = out.filter(pl.col("dg_id") == 1)
+    assert player["rounds"].to_list() == [1, 2, 3, 4]
+    for half_life, name in [(1, "ppi_ewm_1"), (2.5, "ppi_ewm_2.5")]:
+        assert_series_equal(
+            player[name],
+            pl.Series(name, _expected([0, 1, 2, 3], half_life)),
+        )
+
+
+def test_gen_ewm_ppi_days():
+    """Test the decayed PPI with a half-life in days."""
+    out = gen_ewm_ppi(SCORING, COURSE_FACTOR, half_life=30, unit="days").sort(
+        "dg_id", "teetime"
+    )
+
+    player = out.filter(pl.col("dg_id") == 1)
+    ages = [
+        (tee - datetime(2021, 1, 7, 8)) / timedelta(days=1)
+        for tee in player["teetime"].to_list()
+    ]
+    assert_series_equal(
+        player["ppi_ewm_30"], pl.Series("ppi_ewm_30", _expected(ages, 30))
+    )
+
+
+def test_gen_ewm_ppi_days_gaps():
+    """Test that rounds without a course factor still age the decayed PPI."""
+    scoring = pl.DataFrame(
+        {
+            "year": 2021,
+            "event_id": [1, 2, 3] * 2,
+            "event_name": ["one", "two", "three"] * 2,
+            "round": 1,
+            "course_num": [1, 3, 2] * 2,
+            "dg_id": [1, 1, 1, 2, 2, 2],
+            "player_name": ["a", "a", "a", "b", "b", "b"],
+            "score": [71, 70, 70, 73, 74, 74],
+            "sg_total": 0.0,
+            "teetime": [
+                datetime(2021, 1, 7, 8),
+                datetime(2021, 1, 17, 8),
+                datetime(2021, 1, 27, 8),
+            ]
+            * 2,
+        }
+    )
+    course_factor = pl.DataFrame({"course_num": [1, 2], "course_factor_star": 1.0})
+    out = gen_ewm_ppi(scoring, course_factor, half_life=10, unit="days").sort(
+        "dg_id", "teetime"
+    )
+
+    assert out.filter(pl.col("dg_id") == 1)["ppi_ewm_10"].to_list() == pytest.approx(
+        [1.0, 1.0, (0.25 * 1 + 2) / 1.25]
+    )
+
+
+@pytest.mark.parametrize("unit", ["rounds", "days"])
+def test_gen_ewm_ppi_non_finite(unit):
+    """Test that rounds with a non-finite course factor carry no weight."""
+    course_factor = pl.DataFrame(
+        {"course_num": [1, 2, 3], "course_factor_star": [1.0, 2.0, 1.0]}
+    )
+    scoring = pl.concat(
+        [
+            SCORING,
+            SCORING.filter(pl.col("event_id") == 1).with_columns(
+                event_id=pl.col("event_id") + 2,
+                course_num=pl.col("course_num") + 2,
+                teetime=pl.col("teetime").dt.offset_by("7d"),
+            ),
+        ]
+    )
+    expected = gen_ewm_ppi(scoring, course_factor, half_life=30, unit=unit)
+    for value in [float("nan"), float("inf")]:
+        out = gen_ewm_ppi(
+            scoring,
+            course_factor.with_columns(
+                course_factor_star=pl.when(pl.col("course_num") == 3)
+                .then(value)
+                .otherwise(pl.col("course_factor_star"))
+            ),
+            half_life=30,
+            unit=unit,
+        )
+
+        assert out["ppi_ewm_30"].is_finite().all()
+        assert_series_equal(
+            out["ppi_ewm_30"],
+            gen_ewm_ppi(
+                scoring, course_factor.filter(pl.col("course_num") != 3), 30, unit
+            )["ppi_ewm_30"],
+        )
+    assert not out["ppi_ewm_30"].equals(expected["ppi_ewm_30"])
+
+
+def test_gen_ewm_ppi_days_duplicates():
+    """Test that rounds with the same tee time are combined."""
+    scoring = SCORING.with_columns(
+        teetime=pl.when(pl.col("round") == 2)
+        .then(pl.col("teetime").dt.offset_by("-1d"))
+        .otherwise(pl.col("teetime"))
+    )
+    out = gen_ewm_ppi(scoring, COURSE_FACTOR, half_life=30, unit="days").sort(
+        "dg_id", "teetime", "score"
+    )
+
+    player = out.filter(pl.col("dg_id") == 1)
+    assert player["ppi_ewm_30"].is_finite().all()
+    assert player["ppi_ewm_30"][0] == player["ppi_ewm_30"][1]
+    assert player["ppi_ewm_30"][1] == pytest.approx(_expected([0, 0], 30)[1])
+
+
+def test_gen_ewm_ppi_lazy():
+    """Test that the decayed PPI works with lazyframes."""
+    eager = gen_ewm_ppi(SCORING, COURSE_FACTOR, half_life=[5, 10], unit="days")
+    lazy = gen_ewm_ppi(
+        SCORING.lazy(), COURSE_FACTOR.lazy(), half_life=[5, 10], unit="days"
+    ).collect()
+
+    assert eager.equals(lazy)
+
+
+@pytest.mark.parametrize(
+    "kwargs", [{"half_life": 0}, {"half_life": []}, {"unit": "weeks"}]
+)
+def test_gen_ewm_ppi_invalid(kwargs):
+    """Test parameter validation for the decayed PPI."""
+    with pytest.raises(ValueError):
+        gen_ewm_ppi(SCORING, COURSE_FACTOR, **kwargs)
+
+
+def test_gen_rolling_ppi_era():
+    """Test joining era course factors on the course and season."""
+    scoring = pl.concat(
+        [
+            SCORING,
+            SCORING.with_columns(
+                year=pl.col("year") + 1,
+                teetime=pl.col("teetime").dt.offset_by("1y"),
+            ),
+        ]
+    )
+    era_course_factor = pl.DataFrame(
+        {
+            "course_num": [1, 2, 1, 2],
+            "era": [2021, 2021, 2022, 2022],
+            "course_factor_star": [1.0, 2.0, 3.0, 0.0],
+        }
+    )
+    out = gen_rolling_ppi(scoring, era_course_factor, period=2)
+
+    assert out.filter(pl.col("teetime").dt.year() == 2021)[
+        "course_factor_star"
+    ].unique().sort().to_list() == [1.0, 2.0]
+    assert out.filter(pl.col("teetime").dt.year() == 2022)[
+        "course_factor_star"
+    ].unique().sort().to_list() == [0.0, 3.0]
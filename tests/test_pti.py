@@ -3,7 +3,7 @@
 import polars as pl
 from polars.testing import assert_frame_equal
 
-from proper_test_index.pti import calc_course_factor, calc_pti
+from proper_test_index.pti import calc_course_factor, calc_era_course_factor, calc_pti
 
 
 def test_calc_pti():
@@ -72,3 +72,79 @@ def test_calc_course_factor():
     ).with_columns(course_factor_star=(pl.lit(1.0) + pl.col("course_factor")).log10())
 
     assert_frame_equal(out, expected)
+
+
+def test_calc_era_course_factor():
+    """Test calculating course factor over sliding windows of seasons."""
+    pti = pl.DataFrame(
+        {
+            "year": [2020, 2020, 2021, 2022, 2022],
+            "event_id": [1, 2, 1, 1, 2],
+            "event_name": "fake",
+            "course_name": "fake",
+            "course_num": [1, 2, 1, 1, 2],
+            "over_80": [1, 2, 3, 4, 5],
+            "sub_70": [5, 4, 3, 2, 1],
+            "total_rounds": 10,
+            "scoring_average": [70.0, 71.0, 72.0, 73.0, 74.0],
+            "pti": 0.0,
+            "major_championship": False,
+        }
+    )
+    out = calc_era_course_factor(pti.lazy(), seasons=2).collect()
+
+    expected = pl.DataFrame(
+        {
+            "course_num": [2, 1, 1, 2, 1],
+            "course_name": "fake",
+            "era": [2020, 2020, 2021, 2022, 2022],
+            "era_start": [2020, 2020, 2020, 2021, 2021],
+            "total_over_80": [2, 1, 4, 5, 7],
+            "total_sub_70": [4, 5, 8, 1, 5],
+            "total_rounds": [10, 10, 20, 10, 20],
+            "scoring_average": [71.0, 70.0, 71.0, 74.0, 72.5],
+            "other_over_80": [1, 2, 2, 7, 5],
+            "other_sub_70": [5, 4, 4, 5, 1],
+            "course_factor": [
+                100 * (2 / 4) / (1 / 5),
+                100 * (1 / 5) / (2 / 4),
+                100.0,
+                100 * 5 / (7 / 5),
+                100 * (7 / 5) / 5,
+            ],
+        }
+    ).with_columns(course_factor_star=(pl.lit(1.0) + pl.col("course_factor")).log10())
+
+    assert_frame_equal(out, expected, check_dtypes=False)
+
+    # A single era spanning every season matches the pooled course factor
+    pooled = calc_course_factor(pti).sort("course_num")
+    era = calc_era_course_factor(pti, seasons=3).filter(pl.col("era") == 2022)
+    assert_frame_equal(
+        era.sort("course_num").select(pooled.columns), pooled, check_dtypes=False
+    )
+
+
+def test_calc_era_course_factor_single_course():
+    """Test an era without any other course to compare against."""
+    pti = pl.DataFrame(
+        {
+            "year": [2019, 2020, 2020],
+            "event_id": [1, 1, 2],
+            "event_name": "fake",
+            "course_name": "fake",
+            "course_num": [1, 1, 2],
+            "over_80": [1, 2, 3],
+            "sub_70": [4, 5, 6],
+            "total_rounds": 10,
+            "scoring_average": 70.0,
+            "pti": 0.0,
+            "major_championship": False,
+        }
+    )
+    out = calc_era_course_factor(pti, seasons=1)
+
+    assert out.filter(pl.col("era") == 2019).select(
+        "other_over_80", "other_sub_70", "course_factor", "course_factor_star"
+    ).rows() == [(None, None, None, None)]
+    assert out.filter(pl.col("era") == 2020)["course_factor"].is_finite().all()
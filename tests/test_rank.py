@@ -0,0 +1,98 @@
+"""Test the as-of PPI rankings."""
+
+from datetime import date, datetime
+
+import polars as pl
+
+from proper_test_index.rank import gen_ppi_index, gen_ppi_rankings
+
+PPI = pl.DataFrame(
+    {
+        "dg_id": [1, 1, 1, 2, 2, 3],
+        "player_name": ["a", "a", "a", "b", "b", "c"],
+        "ppi": [1.0, 2.0, 0.5, 1.5, 3.0, 0.0],
+        "teetime": [
+            datetime(2024, 1, 4, 8),
+            datetime(2024, 1, 5, 8),
+            datetime(2024, 1, 5, 14),
+            datetime(2024, 1, 4, 9),
+            datetime(2024, 6, 1, 9),
+            datetime(2024, 1, 6, 9),
+        ],
+        "first_tee_time_in_group": [
+            datetime(2023, 1, 4),
+            datetime(2023, 1, 5),
+            datetime(2023, 1, 5),
+            datetime(2023, 1, 4),
+            datetime(2023, 6, 1),
+            datetime(2020, 1, 6),
+        ],
+    }
+)
+
+
+def test_gen_ppi_index():
+    """Test reducing the rolling PPI to one row per player and day."""
+    out = gen_ppi_index(PPI)
+
+    assert out["date"].is_sorted()
+    assert out.filter(pl.col("dg_id") == 1)["ppi"].to_list() == [1.0, 0.5]
+
+
+def test_gen_ppi_rankings():
+    """Test ranking players as of a date."""
+    out = gen_ppi_rankings(
+        PPI, [date(2024, 1, 3), date(2024, 1, 4), date(2024, 1, 5), date(2025, 3, 1)]
+    )
+
+    assert out.select(
+        "as_of", "dg_id", "ppi", "rank", "percentile", "players"
+    ).rows() == [
+        (date(2024, 1, 4), 2, 1.5, 1, 100.0, 2),
+        (date(2024, 1, 4), 1, 1.0, 2, 50.0, 2),
+        (date(2024, 1, 5), 2, 1.5, 1, 100.0, 2),
+        (date(2024, 1, 5), 1, 0.5, 2, 50.0, 2),
+        # Player 1 hasn't played in over a year
+        (date(2025, 3, 1), 2, 3.0, 1, 100.0, 1),
+    ]
+
+
+def test_gen_ppi_rankings_params():
+    """Test the recency parameters."""
+    index = gen_ppi_index(PPI.lazy())
+
+    out = gen_ppi_rankings(index, [date(2024, 7, 1)], max_days=None)
+    assert isinstance(out, pl.LazyFrame)
+    assert out.collect()["dg_id"].to_list() == [2, 1, 3]
+
+    out = gen_ppi_rankings(index, [date(2024, 7, 1)], max_inactive_days=60)
+    assert out.collect()["dg_id"].to_list() == [2]
+
+    out = gen_ppi_rankings(index, [date(2025, 3, 1)], max_inactive_days=None)
+    assert out.collect()["dg_id"].to_list() == [2, 1]
+
+
+def test_gen_ppi_rankings_non_finite():
+    """Test that players with a non-finite PPI aren't ranked."""
+    ppi = pl.concat(
+        [
+            PPI,
+            PPI.filter(pl.col("dg_id") == 2).with_columns(
+                dg_id=pl.col("dg_id") + 2, ppi=float("nan")
+            ),
+        ]
+    )
+
+    out = gen_ppi_rankings(ppi, [date(2024, 1, 5)])
+    assert out.select("dg_id", "rank", "percentile", "players").rows() == [
+        (2, 1, 100.0, 2),
+        (1, 2, 50.0, 2),
+    ]
+
+
+def test_gen_ppi_rankings_unsorted():
+    """Test that a user-supplied index doesn't need to be sorted."""
+    index = gen_ppi_index(PPI)
+
+    out = gen_ppi_rankings(index.sort("ppi"), [date(2024, 1, 5)])
+    assert out.equals(gen_ppi_rankings(index, [date(2024, 1, 5)]))
@@ -0,0 +1,151 @@
+"""Test the query service."""
+
+import asyncio
+import json
+import os
+from datetime import datetime
+
+import polars as pl
+import pytest
+
+from proper_test_index.serve import (
+    ROUTES,
+    ArtifactStore,
+    QueryCache,
+    QueryService,
+    query_leaderboard,
+)
+
+
+@pytest.fixture
+def store(tmp_path) -> ArtifactStore:
+    """Write a minimal set of artifacts."""
+    pl.DataFrame(
+        {
+            "year": [2024, 2025, 2025],
+            "event_id": [14, 14, 2],
+            "event_name": ["Masters", "Masters", "fake"],
+            "pti": [0.9, 0.8, 0.1],
+            "major_championship": [True, True, False],
+        }
+    ).write_csv(tmp_path / "pti.csv")
+    pl.DataFrame({"course_num": [14, 2], "course_factor": [1000.0, 10.0]}).write_csv(
+        tmp_path / "course_factor.csv"
+    )
+    (tmp_path / "data").mkdir()
+    pl.DataFrame(
+        {
+            "dg_id": [1, 1, 2, 3],
+            "player_name": ["a", "a", "b", "c"],
+            "ppi": [0.5, 1.0, 2.0, 3.0],
+            "teetime": [
+                datetime(2024, 4, 1),
+                datetime(2025, 4, 1),
+                datetime(2025, 5, 1),
+                datetime(2024, 5, 1),
+            ],
+            "first_tee_time_in_group": [
+                datetime(2023, 4, 1),
+                datetime(2024, 4, 1),
+                datetime(2020, 5, 1),
+                datetime(2023, 5, 1),
+            ],
+        }
+    ).write_parquet(tmp_path / "data" / "ppi-rolling-50.parquet")
+
+    out = ArtifactStore(tmp_path)
+    out.refresh()
+
+    return out
+
+
+def test_query(store):
+    """Test the queries against the artifacts."""
+    service = QueryService(store)
+
+    course = service.query("/course-factor", {"course_num": "2"})
+    assert course["course_factor"].to_list() == [10.0]
+    assert service.query("/pti", {"majors": "true"})["year"].to_list() == [2024, 2025]
+    assert service.query("/pti", {"year": "2025", "event_id": "2"}).height == 1
+    assert service.query("/player", {"dg_id": "1"})["ppi"].to_list() == [1.0, 0.5]
+    # Player 2's window is too long, player 3 is inactive
+    assert service.query("/leaderboard", {})["dg_id"].to_list() == [1]
+    leaders = service.query("/leaderboard", {"max_days": "2000"})
+    assert leaders["dg_id"].to_list() == [2, 1]
+
+    with pytest.raises(ValueError):
+        service.query("/pti", {"fake": "1"})
+    with pytest.raises(ValueError):
+        service.query("/fake", {})
+
+
+def test_cache(store):
+    """Test caching and reloading."""
+    service = QueryService(store, cache=QueryCache(maxsize=1))
+
+    service.query("/pti", {"year": "2025"})
+    service.query("/pti", {"year": "2025"})
+    assert (service.cache.hits, service.cache.misses) == (1, 1)
+    service.query("/pti", {"year": "2024"})
+    service.query("/pti", {"year": "2025"})
+    assert (service.cache.hits, service.cache.misses) == (1, 3)
+
+    assert not store.refresh()
+    pl.DataFrame({"course_num": [14], "course_factor": [5.0]}).write_csv(
+        store.root / "course_factor.csv"
+    )
+    os.utime(store.root / "course_factor.csv", ns=(0, 0))
+    assert store.refresh()
+    assert service.query("/course-factor", {})["course_factor"].to_list() == [5.0]
+
+
+def test_query_leaderboard_empty(store):
+    """Test the leaderboard without any rounds."""
+    frames = {"ppi": store.frames["ppi"].clear()}
+
+    out = query_leaderboard(frames)
+    assert out.is_empty()
+    assert out.columns == store.frames["ppi"].columns
+
+
+def test_handle(store, monkeypatch):
+    """Test serving a request over HTTP."""
+    service = QueryService(store)
+
+    async def request(target: str, method: str = "GET") -> tuple[str, str]:
+        server = await asyncio.start_server(service.handle, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(
+                f"{method} {target} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode()
+            )
+            await writer.drain()
+            response = (await reader.read()).decode()
+            writer.close()
+            await writer.wait_closed()
+        head, body = response.split("\r\n\r\n", 1)
+
+        return head.splitlines()[0], body
+
+    status, body = asyncio.run(request("/player?dg_id=2"))
+    assert status == "HTTP/1.1 200 OK"
+    assert json.loads(body)[0]["player_name"] == "b"
+
+    status, _ = asyncio.run(request("/fake"))
+    assert status == "HTTP/1.1 404 Not Found"
+
+    status, _ = asyncio.run(request("/player?dg_id=abc"))
+    assert status == "HTTP/1.1 400 Bad Request"
+
+    status, body = asyncio.run(request("/player?dg_id=2", method="POST"))
+    assert status == "HTTP/1.1 405 Method Not Allowed"
+    assert "error" in json.loads(body)
+
+    def fail(frames, dg_id):
+        raise pl.exceptions.ComputeError("bad artifact")
+
+    monkeypatch.setitem(ROUTES, "/player", (fail, {"dg_id": int}))
+    status, body = asyncio.run(request("/player?dg_id=3"))
+    assert status == "HTTP/1.1 500 Internal Server Error"
+    assert json.loads(body) == {"error": "Internal server error"}
@@ -0,0 +1,66 @@
+"""Test the scoring data validation."""
+
+from datetime import datetime
+
+import polars as pl
+from polars.testing import assert_frame_equal
+
+from proper_test_index.validate import ValidationReport, validate_scoring
+
+SCORING = pl.DataFrame(
+    {
+        "year": 2021,
+        "event_id": 535,
+        "dg_id": [1, 1, 1, 1, 2, 2, 2, 3],
+        "round": [1, 2, 3, 3, 1, 2, 3, 1],
+        "course_par": 71,
+        "score": [69, 70, 72, 72, None, 120, 68, 70],
+        "teetime": [
+            datetime(2021, 6, 17, 15, 6),
+            datetime(2021, 6, 18, 7, 51),
+            datetime(2021, 6, 19, 13, 13),
+            datetime(2021, 6, 19, 13, 13),
+            datetime(2021, 6, 17, 8),
+            datetime(2021, 6, 19, 8),
+            datetime(2021, 6, 18, 8),
+            datetime(2021, 6, 18, 8),
+        ],
+    }
+)
+
+
+def test_validate_scoring(tmp_path):
+    """Test validating the scoring data."""
+    valid, report = validate_scoring(
+        SCORING.lazy(), quarantine_path=tmp_path / "quarantine.parquet"
+    )
+
+    assert_frame_equal(valid, SCORING[[0, 1, 2]])
+    assert report == ValidationReport(
+        total_rounds=8,
+        invalid_rounds=5,
+        failures={
+            "duplicate_round": 1,
+            "null_score": 1,
+            "impossible_score": 1,
+            "null_teetime": 0,
+            "round_weekday": 3,
+            "round_order": 2,
+        },
+    )
+    assert not report.is_valid
+
+    quarantine = pl.read_parquet(tmp_path / "quarantine.parquet")
+    assert quarantine["dg_id"].to_list() == [1, 2, 2, 2, 3]
+    assert quarantine.row(0, named=True)["invalid_duplicate_round"]
+
+
+def test_validate_scoring_valid(tmp_path):
+    """Test that valid data passes validation."""
+    valid, report = validate_scoring(
+        SCORING[[0, 1, 2]], quarantine_path=tmp_path / "quarantine.parquet"
+    )
+
+    assert_frame_equal(valid, SCORING[[0, 1, 2]])
+    assert report.is_valid
+    assert pl.read_parquet(tmp_path / "quarantine.parquet").height == 0